@@ -0,0 +1,206 @@
+"""Conditional HTTP GETs backed by an on-disk ETag cache.
+
+Cached bodies are stored unencrypted under ``.cache/``. Entries are keyed by
+URL and by a digest of the Authorization header, so a body fetched with one
+token is never served to a request made without it or with another token.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import io
+import json
+import os
+import sys
+import threading
+from email.message import Message
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, urlopen
+
+
+CACHE_DIR = Path(".cache")
+ETAG_INDEX = CACHE_DIR / "http_etag.json"
+
+REDIRECT_CODES = (301, 302, 307, 308)
+MAX_REDIRECTS = 5
+# methods safe to resend after the server hangs up without a response
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# authenticated GitHub requests get 5000/hr instead of 60/hr per IP
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+RATE_LIMIT_WARN_BELOW = 100
+
+# guards read-modify-write of ETAG_INDEX when fetching from several threads
+_INDEX_LOCK = threading.Lock()
+# per-thread keep-alive connections, keyed by (scheme, netloc)
+_LOCAL = threading.local()
+
+
+def _load_index() -> dict[str, dict[str, str]]:
+    try:
+        return json.loads(ETAG_INDEX.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_index(index: dict[str, dict[str, str]]) -> None:
+    ETAG_INDEX.parent.mkdir(parents=True, exist_ok=True)
+    ETAG_INDEX.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    pool = getattr(_LOCAL, "connections", None)
+    if pool is None:
+        pool = _LOCAL.connections = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        conn_cls = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        conn = pool[(scheme, netloc)] = conn_cls(netloc, timeout=timeout)
+    return conn
+
+
+def _drop_connection(scheme: str, netloc: str) -> None:
+    conn = _LOCAL.connections.pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _send_once(
+    method: str, url: str, data: bytes | None, headers: dict[str, str], timeout: float
+) -> tuple[int, Message, bytes]:
+    parts = urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+
+    for attempt in range(2):
+        conn = _connection(parts.scheme, parts.netloc, timeout)
+        reused = conn.sock is not None
+        sent = False
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            sent = True
+            response = conn.getresponse()
+            return response.status, response.headers, response.read()
+        except BaseException as exc:
+            # timeouts and partial reads leave the socket in an unknown state
+            _drop_connection(parts.scheme, parts.netloc)
+            # A reused keep-alive socket may have been closed while idle.
+            # Resend once if the request never got out, or if the server hung
+            # up without answering an idempotent one; never otherwise.
+            stale = (
+                reused
+                and attempt == 0
+                and (
+                    (not sent and isinstance(exc, ConnectionError))
+                    or (
+                        isinstance(exc, http.client.RemoteDisconnected)
+                        and method in IDEMPOTENT_METHODS
+                    )
+                )
+            )
+            if not stale:
+                raise
+    raise AssertionError("unreachable")
+
+
+def _warn_if_rate_limited(url: str, headers: Message) -> None:
+    remaining = headers.get("X-RateLimit-Remaining")
+    if remaining is None or not remaining.isdigit():
+        return
+    if int(remaining) < RATE_LIMIT_WARN_BELOW:
+        sys.stderr.write(
+            f"warning: GitHub rate limit nearly exhausted ({remaining} requests left, "
+            f"resets at epoch {headers.get('X-RateLimit-Reset', '?')}) after {url}\n"
+        )
+
+
+def send(req: Request, timeout: float) -> tuple[int, Message, bytes]:
+    """Send ``req`` and return ``(status, headers, body)`` without raising on status.
+
+    Requests reuse one keep-alive connection per host and thread, so paged API
+    calls share a single TCP/TLS handshake. When a proxy is configured the
+    request goes through ``urlopen`` instead, which handles tunnelling.
+    """
+    url = req.full_url
+    headers = dict(req.header_items())
+    if getproxies().get(urlsplit(url).scheme):
+        try:
+            with urlopen(req, timeout=timeout) as response:
+                status, response_headers, body = (
+                    response.status, response.headers, response.read()
+                )
+        except HTTPError as exc:
+            status, response_headers, body = exc.code, exc.headers, exc.read()
+        _warn_if_rate_limited(url, response_headers)
+        return status, response_headers, body
+
+    for _ in range(MAX_REDIRECTS + 1):
+        status, response_headers, body = _send_once(
+            req.get_method(), url, req.data, headers, timeout
+        )
+        _warn_if_rate_limited(url, response_headers)
+        location = response_headers.get("Location")
+        if status not in REDIRECT_CODES or not location:
+            return status, response_headers, body
+        next_url = urljoin(url, location)
+        old, new = urlsplit(url), urlsplit(next_url)
+        if (new.scheme, new.netloc) != (old.scheme, old.netloc):
+            # never forward credentials to another origin, including an
+            # https -> http downgrade on the same host
+            headers.pop("Authorization", None)
+        url = next_url
+    raise HTTPError(url, status, "too many redirects", response_headers, io.BytesIO(body))
+
+
+def request_bytes(req: Request, timeout: float) -> bytes:
+    """Send ``req`` and return the body, raising ``HTTPError`` on non-2xx."""
+    status, headers, body = send(req, timeout)
+    if not 200 <= status < 300:
+        raise HTTPError(req.full_url, status, f"HTTP {status}", headers, io.BytesIO(body))
+    return body
+
+
+def _cache_key(url: str, authorization: str | None) -> str:
+    if not authorization:
+        return url
+    # a digest keeps the token itself out of the index
+    return f"{url} auth:{hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16]}"
+
+
+def fetch_bytes(req: Request, timeout: float) -> bytes:
+    """GET ``req``, revalidating a previously cached body with If-None-Match.
+
+    On HTTP 304 the cached body is returned; on 200 the new body and ETag
+    replace the cached copy.
+    """
+    url = req.full_url
+    key = _cache_key(url, req.get_header("Authorization"))
+    with _INDEX_LOCK:
+        entry = _load_index().get(key)
+    if entry and Path(entry["body_path"]).is_file():
+        req.add_header("If-None-Match", entry["etag"])
+    else:
+        entry = None
+
+    status, headers, body = send(req, timeout)
+    if status == 304 and entry is not None:
+        return Path(entry["body_path"]).read_bytes()
+    if not 200 <= status < 300:
+        raise HTTPError(url, status, f"HTTP {status}", headers, io.BytesIO(body))
+
+    etag = headers.get("ETag")
+    if etag:
+        body_path = CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.body"
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        with _INDEX_LOCK:
+            index = _load_index()
+            index[key] = {"etag": etag, "body_path": str(body_path)}
+            _save_index(index)
+    return body
@@ -0,0 +1,258 @@
+"""Shared helpers for the LLVM version-watch scripts."""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlencode
+from urllib.request import Request
+
+from _http_cache import GITHUB_TOKEN, fetch_bytes, request_bytes
+
+
+TAG_RE = re.compile(r"^llvmorg-(\d+)\.(\d+)\.(\d+)$")
+# major.minor of any llvmorg tag, release candidates included
+TAG_MINOR_RE = re.compile(r"^llvmorg-(\d+)\.(\d+)")
+# KEY=VALUE lines of versions.env; [ \t] keeps an empty value from eating the
+# next line, and a trailing \r (CRLF checkouts) is never part of the value
+ENV_ASSIGNMENT_RE = re.compile(
+    r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+# built once and shared by every page request
+API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "flang-releases-version-watch",
+}
+if GITHUB_TOKEN:
+    API_HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+GRAPHQL_HEADERS = {**API_HEADERS, "Content-Type": "application/json"}
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+TAGS_QUERY = """
+query($cursor: String, $first: Int!) {
+  repository(owner: "llvm", name: "llvm-project") {
+    refs(refPrefix: "refs/tags/llvmorg-", first: $first, after: $cursor,
+         orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) {
+      nodes { name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+def parse_versions_env(path: Path) -> dict[str, str]:
+    return dict(ENV_ASSIGNMENT_RE.findall(path.read_text(encoding="utf-8")))
+
+
+def load_matrix(path: Path) -> list[dict]:
+    data = json.loads(path.read_bytes())
+    return data.get("versions", [])
+
+
+def save_matrix(path: Path, entries: list[dict]) -> None:
+    path.write_text(
+        json.dumps({"versions": entries}, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def list_llvm_tags_graphql(
+    max_pages: int = 5,
+    per_page: int = 100,
+    tracked_minors: set[tuple[int, int]] | None = None,
+) -> list[str]:
+    """List ``llvmorg-*`` tag names via GraphQL, fetching only the names."""
+    tags: list[str] = []
+    seen: dict[tuple[int, int], list[int]] = {}
+    cursor: str | None = None
+    for _ in range(max_pages):
+        body = json.dumps(
+            {"query": TAGS_QUERY, "variables": {"cursor": cursor, "first": per_page}}
+        ).encode("utf-8")
+        req = Request(GRAPHQL_URL, data=body, method="POST", headers=GRAPHQL_HEADERS)
+        payload = json.loads(request_bytes(req, timeout=30))
+        if payload.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL error: {payload['errors']}")
+        refs = payload["data"]["repository"]["refs"]
+        # names are relative to refPrefix, so restore the stripped "llvmorg-"
+        batch = [f"llvmorg-{node['name']}" for node in refs["nodes"]]
+        tags.extend(batch)
+        if not refs["pageInfo"]["hasNextPage"]:
+            break
+        if tracked_minors and _can_stop_paging(seen, batch, tracked_minors):
+            break
+        cursor = refs["pageInfo"]["endCursor"]
+    return tags
+
+
+def list_llvm_tags(
+    max_pages: int = 5,
+    per_page: int = 100,
+    tracked_minors: set[tuple[int, int]] | None = None,
+) -> list[str]:
+    """List upstream LLVM tag names, newest first.
+
+    With ``tracked_minors``, paging stops early once every tracked minor has a
+    release tag and even the newest tag on the current page is older than all
+    of them. Neither listing is ordered by version (GraphQL sorts by commit
+    date, REST by name, so llvmorg-9.* precedes llvmorg-19.*), so one older
+    tag on a page is not enough to stop.
+    """
+    if GITHUB_TOKEN:
+        return list_llvm_tags_graphql(max_pages, per_page, tracked_minors)
+
+    # GraphQL requires authentication; fall back to the paged REST listing
+    tags: list[str] = []
+    seen: dict[tuple[int, int], list[int]] = {}
+    for page in range(1, max_pages + 1):
+        params = urlencode({"per_page": per_page, "page": page})
+        url = f"https://api.github.com/repos/llvm/llvm-project/tags?{params}"
+        batch = json.loads(fetch_bytes(Request(url, headers=API_HEADERS), timeout=30))
+        if not batch:
+            break
+        names = [item.get("name", "") for item in batch]
+        tags.extend(names)
+        if tracked_minors and _can_stop_paging(seen, names, tracked_minors):
+            break
+    return tags
+
+
+def load_llvm_tags(
+    cache_path: Path | None = None,
+    tracked_minors: set[tuple[int, int]] | None = None,
+) -> list[str]:
+    """Return upstream LLVM tag names, reusing ``cache_path`` when present.
+
+    Back-to-back invocations in one workflow job can share a single fetch by
+    pointing at the same cache file; the first run writes it, so it should
+    track a superset of the minors later runs ask for.
+    """
+    if cache_path is not None and cache_path.is_file():
+        return json.loads(cache_path.read_bytes())
+
+    tags = list_llvm_tags(tracked_minors=tracked_minors)
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(tags) + "\n", encoding="utf-8")
+    return tags
+
+
+def parse_tracked_minor(tracked_minor: str) -> tuple[int, int]:
+    parts = tracked_minor.split(".", 1)
+    if len(parts) != 2:
+        raise ValueError(f"TRACKED_LLVM_MINOR must be '<major>.<minor>', got: {tracked_minor}")
+    return int(parts[0]), int(parts[1])
+
+
+def index_tags(tags: list[str]) -> dict[tuple[int, int], list[int]]:
+    """Bucket release tag patches by (major, minor) in a single pass."""
+    out: dict[tuple[int, int], list[int]] = {}
+    for tag in tags:
+        match = TAG_RE.match(tag)
+        if not match:
+            continue
+        key = (int(match.group(1)), int(match.group(2)))
+        out.setdefault(key, []).append(int(match.group(3)))
+    return out
+
+
+def _can_stop_paging(
+    seen: dict[tuple[int, int], list[int]],
+    batch: list[str],
+    tracked_minors: set[tuple[int, int]],
+) -> bool:
+    """Merge ``batch`` into ``seen`` and report whether paging can stop."""
+    for key, patches in index_tags(batch).items():
+        seen.setdefault(key, []).extend(patches)
+    if not tracked_minors <= seen.keys():
+        return False
+    # newest major.minor on this page, release candidates included
+    minors = [
+        (int(match.group(1)), int(match.group(2)))
+        for match in map(TAG_MINOR_RE.match, batch)
+        if match
+    ]
+    return bool(minors) and max(minors) < min(tracked_minors)
+
+
+def latest_patch_from_index(
+    index: dict[tuple[int, int], list[int]], tracked_minor: str
+) -> str:
+    major, minor = parse_tracked_minor(tracked_minor)
+    patches = index.get((major, minor))
+    if not patches:
+        raise RuntimeError(f"No llvm tags found for TRACKED_LLVM_MINOR={tracked_minor}")
+    return f"{major}.{minor}.{max(patches)}"
+
+
+def find_latest_patch(tags: list[str], tracked_minor: str) -> str:
+    major, minor = parse_tracked_minor(tracked_minor)
+
+    # fast path: plain prefix test, no regex, and let max() compare ints
+    prefix = f"llvmorg-{major}.{minor}."
+    start = len(prefix)
+    patches = [
+        int(tag[start:])
+        for tag in tags
+        if tag.startswith(prefix) and tag[start:].isdecimal()
+    ]
+    if patches:
+        return f"{major}.{minor}.{max(patches)}"
+
+    best: tuple[int, int, int] | None = None
+    for tag in tags:
+        match = TAG_RE.match(tag)
+        if not match:
+            continue
+        m_major, m_minor, m_patch = map(int, match.groups())
+        if m_major != major or m_minor != minor:
+            continue
+        candidate = (m_major, m_minor, m_patch)
+        if best is None or candidate > best:
+            best = candidate
+
+    if best is None:
+        raise RuntimeError(f"No llvm tags found for TRACKED_LLVM_MINOR={tracked_minor}")
+    return f"{best[0]}.{best[1]}.{best[2]}"
+
+
+def write_updated_versions_env(
+    path: Path, latest_version: str, fork_ref_template: str, current_fork_ref: str
+) -> str:
+    new_fork_ref = fork_ref_template.format(version=latest_version)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    replaced_llvm = False
+    replaced_ref = False
+
+    out_lines: list[str] = []
+    for line in lines:
+        if line.startswith("LLVM_VERSION="):
+            out_lines.append(f"LLVM_VERSION={latest_version}")
+            replaced_llvm = True
+            continue
+        if line.startswith("LLVM_FORK_REF="):
+            out_lines.append(f"LLVM_FORK_REF={new_fork_ref}")
+            replaced_ref = True
+            continue
+        out_lines.append(line)
+
+    if not replaced_llvm:
+        out_lines.append(f"LLVM_VERSION={latest_version}")
+    if not replaced_ref:
+        out_lines.append(f"LLVM_FORK_REF={new_fork_ref}")
+
+    path.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+    return new_fork_ref if current_fork_ref != new_fork_ref else current_fork_ref
+
+
+def emit_output(output_path: str | None, values: dict[str, str]) -> None:
+    lines = [f"{k}={v}" for k, v in values.items()]
+    text = "\n".join(lines) + "\n"
+    if output_path:
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
@@ -0,0 +1,531 @@
+"""Generated by scripts/gen_emsdk_map_py.py from emsdk-llvm-map.json. Do not edit."""
+
+SOURCE_SIZE = 42153
+SOURCE_SHA256 = "b1f9343e2bd226909b278ab648646c2bdd219197d58cb3ed643b2ad59a5f187c"
+
+POLICY = {'18': None,
+ '19': '3.1.52',
+ '20': '3.1.64',
+ '21': '4.0.1',
+ '22': '4.0.11',
+ '23': '4.0.23',
+ '24': '5.0.1'}
+
+RELEASES = {'3.1.52': {'binary_checksums': {'sha_linux': '1c0cd572067c6348cea5e347b9ef7c5460493ca3f0d84bb991689731d0e140ef',
+                                 'sha_mac': '5d9c801f9cfe81337d65969e174e0b3ef4cf2b47eb548ff4695abe3a2e69ba70',
+                                 'sha_mac_arm64': '7ce8fef7542437c85412143cb59b13b8804bb06243a106d2d342c7d9132edc8e',
+                                 'sha_win': '82ed01d965f5c2765191c67da5baecd2d3ce3f82a8cf30fc47fcd56d47826cf6'},
+            'emscripten_release_hash': 'ce2097fb81953331e65543c20b437475f218127c',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.52'},
+            'llvm_major_estimate': 18,
+            'llvm_version_estimate': '18.0.0',
+            'llvm_commit_hash': '0a3a0ea5914cb4633f4f4c14f1ddc46ce067061a',
+            'llvm_commit_date': '2024-01-18'},
+ '3.1.53': {'binary_checksums': {'sha_linux': '1025c0c738fbaedf3f8fcffee23bef71c8d04a95b30ea8a69a47231fb35d1c8b',
+                                 'sha_mac': '318dc0cc51a237040bc1cb0a9e7d6c214196c8a100b50d0e298cf3ea7c365dbe',
+                                 'sha_mac_arm64': 'e346ef588f7cfe1e41623de2257a11ecf8381fbd3bde63a8773b3a663411ea12',
+                                 'sha_win': 'af7f7175ab0b3c1e9121c713764e8ac1d970b6dbee8a84602b4a69cc5ec5940d'},
+            'emscripten_release_hash': 'e5523d57a0e0dcf80f3b101bbc23613fcc3101aa',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.53'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': 'febb4c42b192ed7c88c17f91cb903a59acf20baf',
+            'llvm_commit_date': '2024-01-29'},
+ '3.1.54': {'binary_checksums': {'sha_linux': '5c8db804abe1ac7ddaa99a6997683cf9fa9004de655b32b5b612d59a94bd59d0',
+                                 'sha_mac': 'e6d2b8c6983767c7ced83d40b87081a221f05bab08d0fa4f0c6de652547c8a9f',
+                                 'sha_mac_arm64': '83764751ee5c7b42529e1df168695d4a51a23c9c165f3f90693baa9bd9256efa',
+                                 'sha_win': 'c0a1c9f3e1dfc9bb2e600501aea999f53b34a16f82da387317fdcae7e9c2a79b'},
+            'emscripten_release_hash': 'aa1588cd28c250a60457b5ed342557c762f416e3',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.54'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': 'e769fb8699e3fa8e40623764f7713bfc783b0330',
+            'llvm_commit_date': '2024-02-15'},
+ '3.1.55': {'binary_checksums': {'sha_linux': '2a1cccc2f6db801219eb966d00af78a026af7822055064092387e7eba18e75ad',
+                                 'sha_mac': 'f1f8f4ebd086d0cd8bd54c41c6a0e86bbb26d7b8020484fef3dba67cd9e6906c',
+                                 'sha_mac_arm64': '7533b7a1beaa692a4f1e57b91c456b13e6bcc367dc9a414cb066350e8a2058c7',
+                                 'sha_win': '204984cbb755f9aa09c21b49129d908f59617a60d5aebd8742097a9a2c196abb'},
+            'emscripten_release_hash': 'f5557e3b7166d05bddb5977e363ec48cd06e9d32',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.55'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': '6c7805d5d186a6d1263f90b8033ad85e2d2633d7',
+            'llvm_commit_date': '2024-02-29'},
+ '3.1.56': {'binary_checksums': {'sha_linux': '52338cca556002251e5e7d738adb1870d14331ddf463e613af02028b64e05a82',
+                                 'sha_mac': 'fc5cca6a9db571ecb2974bf0d4e12f1bc6068726271464586cf7e8723004b4c6',
+                                 'sha_mac_arm64': 'aed728d09d801c4a33210505874ce066269292e7809a7d6a6414146be01545f1',
+                                 'sha_win': 'cd5fbe94fb0bcf01badc10eace48eddbca22b34f31229e3d70c68ade7bcdd571'},
+            'emscripten_release_hash': '9d106be887796484c4aaffc9dc45f48a8810f336',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.56'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0'},
+ '3.1.57': {'binary_checksums': {'sha_linux': '5bc444132258d4404d396f2044a4a334064ad0f1022555cad5ec72804a98ba5a',
+                                 'sha_linux_arm64': 'f0022413afcc1610deff10921b3f5938bf4d01eba46ce96655f2295bdd84bd6a',
+                                 'sha_mac': '31ddccb68c86f0a45332982938c49505158860ed4f7e8ccef72a48382e0e3c96',
+                                 'sha_mac_arm64': 'cc5fdb65b339464f99b9c731cc63c233ec9577268886a856fa49f227ca2a56d1',
+                                 'sha_win': 'b53555420bb9b6e31c153e4c59427000ec692be17ae900f659a9b774d1ecebed'},
+            'emscripten_release_hash': '523b29e1b99a61069a2fa9f9d3cc9be1c4c53d4d',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.57'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0'},
+ '3.1.58': {'binary_checksums': {'sha_linux': 'b188249ecb939dadc679aaf2d3d9afd0fe19ab942f91b7bc926b4f252915dd1a',
+                                 'sha_linux_arm64': '4aedc8ca641b40d9bd82d85b1dc3458fe1afc9a132da06a09384a5f89c058969',
+                                 'sha_mac': '2092aa4bef3b9f88d3f343b042a417ba617d4e04454656d8f2e101ba53f854e8',
+                                 'sha_mac_arm64': '7a9a15845257629b7602d15bdf7633a8e10472b0fa9b3d9ee7149938aa2f2039',
+                                 'sha_win': '9fe76b6189566d56f0cf9aecbd23a006778530aa87184a900f5662e39ce7272a'},
+            'emscripten_release_hash': 'a4d4afb626c5010f6ccda4638b8d77579a63782e',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.58'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0'},
+ '3.1.59': {'binary_checksums': {'sha_linux': 'ae59d1946cb92e1651cbb904fe824b3f07b39f42fa25f582116b5aaa226fa239',
+                                 'sha_linux_arm64': '25b918d6d5ee2af7ef6b28e089dc21d2dc419dca76c8079bb638cb20459eb9e5',
+                                 'sha_mac': 'af175bd559cb80459749e504da314af0163291f195461bf4d376d6980c4c60c3',
+                                 'sha_mac_arm64': 'e17553bca5d00b30c920595e785281627e973f9e7e14c5dc0a73c355ccafe113',
+                                 'sha_win': 'bb54256fc3b7824cb75d5474f887d9bf8e1e63c15b351bdfbed898aa293ee4ab'},
+            'emscripten_release_hash': 'e20ee09a8a740544c4bc6de5d4ba5f81f74b74d6',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.59'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0'},
+ '3.1.60': {'binary_checksums': {'sha_linux': 'ff5eb062165920c7cb69935d396f13e9f8ca5b13f2d7f3af2759bcacb5e877e2',
+                                 'sha_linux_arm64': '2c291942df4868d3f65b31dd964bda9736bfddcd6a7886158963f797d1b45cf5',
+                                 'sha_mac': '45586fab1bad65a4293ea8939dafb5ec711ba92ae7b4d1edbaae3b4486f398b5',
+                                 'sha_mac_arm64': '8dc27416a378ad07285d380f68717cfe0db1ea6252fdb1ad012af95e4d3f342e',
+                                 'sha_win': 'f3147ef2d4ca48ea2624039969fd0529d0bacb63bf49ee4809c681902768b973'},
+            'emscripten_release_hash': '87709b5747de5b1993fe314285528bf4b65c23e1',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.60'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': 'bc9823cf60bf91cc8b45248c4205cd2c67b2a3d5',
+            'llvm_commit_date': '2024-05-17'},
+ '3.1.61': {'binary_checksums': {'sha_linux': 'e3e20e09219fd47a0019bb3252e17db4a00ded39b39b41634bc73f840a8ff2be',
+                                 'sha_linux_arm64': 'a6b858601ca09fb7bb6ddf1a5ffb1a4130454c936ad046d45fef183037828c46',
+                                 'sha_mac': '1fe69a3c42fb2857b80c8e77bfab780cb212ed7cf81ae57c0c4d235504df5269',
+                                 'sha_mac_arm64': '4ba702eea409e2d4bfabc73a68919217d3993e7585d95734e3e40a3c9ce1bd21',
+                                 'sha_win': 'bbafba849ff072a61dd34a8ffc0c85eed20a417854a3ca751b092e3565a92581'},
+            'emscripten_release_hash': '28e4a74b579b4157bda5fc34f23c7d3905a8bd6c',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.61'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': '7cfffe74eeb68fbb3fb9706ac7071f8caeeb6520',
+            'llvm_commit_date': '2024-05-30'},
+ '3.1.62': {'binary_checksums': {'sha_linux': 'fd303a2b2a85c4b3ab8aa29595d70c5fde9df71c5254d56ed19d54e9ee98e881',
+                                 'sha_linux_arm64': '233c0df77644472cd322b45b2d7cf709e6c338799b46f6ec5d5f39ca4dbe8aef',
+                                 'sha_mac': 'd9cfef7ba8f44bf21be715244d0d5f909f1ccc2a481a301b3c01d12d1babc049',
+                                 'sha_mac_arm64': 'de5484d60c858aaa8b93ba6485924adffe734cf4f8296765c089900cf9ce0701',
+                                 'sha_win': '7455680bf9c19a26fe4868111ac01401023b0f92e862d3cabadf7950b87707fd'},
+            'emscripten_release_hash': 'd52176ac8e07c47c1773bb2776ebd91e3886c3af',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.62'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': 'c00ada070207979f092be9046a02fcfff8b9f9ce',
+            'llvm_commit_date': '2024-06-29'},
+ '3.1.63': {'binary_checksums': {'sha_linux': '2a38ac1ea2fe3b7169879f0f666ea278f344cbb5db6e34421b9554939559109c',
+                                 'sha_linux_arm64': 'f1dd5fe4cd22e89b1f5bfd216f1245f9f40f6ea76651a7f66e925a68ff6f18b8',
+                                 'sha_mac': '7e192b84aecfade22817b5b38f0c69d1f795a9b990308188d39ed1d218692cd3',
+                                 'sha_mac_arm64': '751ef26a3682f5f23dfdc1c2f80cd0604a32cad61e6373c823de774722ecb9af',
+                                 'sha_win': '947f8e867e781750d374d659644897f2345a133ad3d0f9ade23afcb81eeaddd3'},
+            'emscripten_release_hash': 'aeb36a44b29e8ca9f4c7efbb4735b69003ac2bb9',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.63'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': 'f6712d27874004835170e6eb8ff5f348a8866057',
+            'llvm_commit_date': '2024-07-09'},
+ '3.1.64': {'binary_checksums': {'sha_linux': 'c39de24beca60fd580f6dff0eca0e275016042a30234588b19eda82397e299f3',
+                                 'sha_linux_arm64': '61b412135630a60c5517278dc83930e06f80fa286fcc2bb6366c4f620c86e4e0',
+                                 'sha_mac': '2644772be398c8095621b3d0fe9ff2d122b18b7b0963c0eb702639d94dfb8e90',
+                                 'sha_mac_arm64': '47449057c345a09aa8750be1a357c364ffea9f8a066066cb341a7a2a14bac96a',
+                                 'sha_win': 'eb5b59afb420915daab4c383e5f73d456cc14776dce02fdc852c46522cda5531'},
+            'emscripten_release_hash': 'fd61bacaf40131f74987e649a135f1dd559aff60',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.64'},
+            'llvm_major_estimate': 19,
+            'llvm_version_estimate': '19.0.0',
+            'llvm_commit_hash': '4d8e42ea6a89c73f90941fd1b6e899912e31dd34',
+            'llvm_commit_date': '2024-07-20'},
+ '3.1.65': {'binary_checksums': {'sha_linux': 'b2b7de13d37c4c5126e6c6a077e6019ebacc78ef1fb1b35b9035f03975f5ffaa',
+                                 'sha_linux_arm64': 'f838af6495408f3c0a14d233171b4919b62e445c62805a22dea1875cb709a116',
+                                 'sha_mac': 'cc50b829a21a041979e0941cfd2047d30a06e3c4a8fd9f662ecdc12a0ab40535',
+                                 'sha_mac_arm64': 'db4430db6a085d6ed5284917e632541dad3ce0a9464659fb674055247ad059d0',
+                                 'sha_win': 'e72ae4ec3231d9a492eadbf77ff28c13efd90307a69df04234792e67a001d05e'},
+            'emscripten_release_hash': 'fdcf56c75a1d27fdff6525a7e03423595485ca19',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.65'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0',
+            'llvm_commit_hash': '547917aebd1e79a8929b53f0ddf3b5185ee4df74',
+            'llvm_commit_date': '2024-08-22'},
+ '3.1.66': {'binary_checksums': {'sha_linux': 'b10eac37c978b28da2f1f34cdd8a7759c0ed5e5a2d8eb4f4e6790209de33dbf7',
+                                 'sha_linux_arm64': '9c78a470f74c24fc1fde2c8d86583ed98847b6cbdd87cd0b36ff2d6b4799d950',
+                                 'sha_mac': '64fd0603ccbf949967cb0dfd8f1b0b25e018abf8bfe813b53596c4fc78751027',
+                                 'sha_mac_arm64': 'fd6250f25101957f56086d292263379880c4b3329819a021008b2058f92ef67b',
+                                 'sha_win': 'b24f65a1a1111d8ace6ba47b55e07681cd0620f7bf711d1018ee262c9501defc'},
+            'emscripten_release_hash': '243eae09cf5c20c4fde51a620b92f483255c8214',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.66'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0'},
+ '3.1.67': {'binary_checksums': {'sha_linux': '535b64822916c80124363a5c7a5bd0cafd703f166d5155c0ad0e464e4a879091',
+                                 'sha_linux_arm64': '04c5f959702d8c1e5c000752b562271c224dee593e81144280840fed06e36cd9',
+                                 'sha_mac': '692b8fdc79a47332ba9881966c72517eedf15b2da7bed37a535dfec55e6bbd9c',
+                                 'sha_mac_arm64': 'ac26753f59fa9c8e92be9c91666014ad9400c91fbd37064105d1b5fcae503985',
+                                 'sha_win': '8c6af8046ed47386018e42d18b53f57fad0926306dd4315d7f09dfae844b3dd3'},
+            'emscripten_release_hash': '4ae62984ea36ef0e5bfcbd0ed9b62f04bee6426a',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.67'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0'},
+ '3.1.68': {'binary_checksums': {'sha_linux': '1f2bcb47d85eb31d90fa797b3513221adc50f0656bb37f0962a40fd0f49fcf6a',
+                                 'sha_linux_arm64': 'de346e7a489aa27a442215945d154d58a0d35c608b6150b2992af0e70c04e1c5',
+                                 'sha_mac': 'b180711544d783121370d2c894703f99d370a864ab147730f82fd59b88fa3481',
+                                 'sha_mac_arm64': '5e9b6242b56edc8cb404cbaf6c8bd7eb1f0f168b55b580bd92652f98c5d286f4',
+                                 'sha_win': '824d37e8a0845f44e4c1111e8365640eea28944f1bdbd1e9e3fea0279b68baea'},
+            'emscripten_release_hash': 'b52d8c9150dc7d4c8e4a7a08c7a9b4006c9abe49',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.68'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0'},
+ '3.1.69': {'binary_checksums': {'sha_linux': '24a786666e6f48ed3c3944b44df5cf146c45cf4faece4cb2686312a3d052a00c',
+                                 'sha_linux_arm64': '48e670501d215ac5b6b2680c900c517d9028dbc4de43be5dd6f25211a3640f2b',
+                                 'sha_mac': '8503fe87dd2f30abff2550e9d6eb8aadeaf30fd3c6972d635b31e67f82e155f7',
+                                 'sha_mac_arm64': '995c7b3c84458edf6b8945e81405320c64a25dfe79eaa427fc1fe9a680f56b4f',
+                                 'sha_win': '3839e0a581ae7b19156f004762a8221585e9a0d6237e468b13a878d1947636c5'},
+            'emscripten_release_hash': '8fe01288bc35668c13316324336ea00195dfb814',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.69'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0'},
+ '3.1.70': {'binary_checksums': {'sha_linux': 'c29b4a2c6addd5aafa613768d34273a23d8fcd1753c685ff61099506710cd8d7',
+                                 'sha_linux_arm64': 'b13386975023a06f19057daef3896d480229b144d1e97f8764ed2f3e0fcb7d37',
+                                 'sha_mac': 'bc0edcaaaa19daeda9164d38d36c5f7d7b4b4e1eb7695ad58e776336c571fcc4',
+                                 'sha_mac_arm64': 'e470d5eeb570850d66a79bd4c06064b9b3a1e90c7c2101e1a444ebcd6466fe5a',
+                                 'sha_win': 'f0118d71fd67583ddcfd39af2ed8bec3d18152fb6aadee085ebec5bcaf4ac4f5'},
+            'emscripten_release_hash': '6fa6145af41e835f3d13edf7d308c08e4573357a',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.70'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0',
+            'llvm_commit_hash': 'f52b89561f2d929c0c6f37fd818229fbcad3b26c',
+            'llvm_commit_date': '2024-10-24'},
+ '3.1.71': {'binary_checksums': {'sha_linux': '43f87aa84a73697b905d2a13c89d016af8ec66bed792f37dd5a0059529abee12',
+                                 'sha_linux_arm64': 'd25f5e57b2e7557df39cd9dec3b0283fb086f66c800af3d9a3f70f36c5fc6b14',
+                                 'sha_mac': '8dac015c03c4f2e594d8bca25fe35d1e4d808aea81705121e852aff0464c4a9d',
+                                 'sha_mac_arm64': 'a7797c3d210eda29f88eede261fc8f0aabf22c7b05214916b5b50a1271e9f0b8',
+                                 'sha_win': 'dfe77eaf22278ca975519f0497c8b336c86e52461c478060418fe67b39b6e87c'},
+            'emscripten_release_hash': '7ee0f9488f152e9e9cf0d4d243970e03742f1a5c',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.71'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0',
+            'llvm_commit_hash': 'd6344c1cd0d099f8d99ee320f33fc9254dbe8288',
+            'llvm_commit_date': '2024-11-04'},
+ '3.1.72': {'binary_checksums': {'sha_linux': 'be094d6dd27c27a64116e9c0165d6cade5d329f5137e56696773e98e1df83fa7',
+                                 'sha_linux_arm64': '5dba64454809d72d53c432f3c91830d69d413ebd9dcd0ce18df5a79a3af235a6',
+                                 'sha_mac': '52f713c118717814d2371912ab9019a3605b7d6acc627f3842e6aa7d3ffff7bf',
+                                 'sha_mac_arm64': '644593539684f59c635c7eae2e743f5e4e27b1d665f9c71c23dcefd4c2448b3c',
+                                 'sha_win': 'c72623fb68f109d8f122036f25b9fc75353bd1ce28995d9920277d4be4a1d99c'},
+            'emscripten_release_hash': '7a360458327cd24c2a7aab428bdbcb5bca8810e4',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.72'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0',
+            'llvm_commit_hash': '1c4caece05f1885ba6ed80755d6b5de1b9f99579',
+            'llvm_commit_date': '2024-11-18'},
+ '3.1.73': {'binary_checksums': {'sha_linux': '4f3bc91cffec9096c3d3ccb11c222e1c2cb7734a0ff9a92d192e171849e68f28',
+                                 'sha_linux_arm64': 'e6fb8a32889d4e4a3ac3e45d8012641369251ddd1255ada132ff6c70ab62b932',
+                                 'sha_mac': '8d52ec080834f49996534de26772800dee048ec9bf148bb508be95887e267735',
+                                 'sha_mac_arm64': '58e6c984c5a1fb71e0871f0c3bb9e32d41e7553260c6eeb38800a4612623a99d',
+                                 'sha_win': 'd76003fad2146ad1f2289e8b251fbc359406ced0857f141a41f15149c2138302'},
+            'emscripten_release_hash': 'b363a836e75a245c548b7a6a021822d8c9e4c6df',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.73'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0',
+            'llvm_commit_hash': '1d810ece2b2c8fab77720493864257f0ea3336a9',
+            'llvm_commit_date': '2024-11-27'},
+ '3.1.74': {'binary_checksums': {'sha_linux': 'a987bb4cded4f29437e8589accac204ce3c134feaaaf251bb97d0fdf450dce65',
+                                 'sha_linux_arm64': 'c7fcc532eb7ee1dc7df0eacb49128ded12e4d55a973b8a2a5215da8bb6c4027c',
+                                 'sha_mac': '04f848f40bd19220a43abde2dd1012d95bf1f89c618c0f631b83d18357e2bb65',
+                                 'sha_mac_arm64': 'fc71758a5bfb02b8a5c2dd21d6bfc34aa3c64698f6105e204a1f4d11f6d67603',
+                                 'sha_win': '603b0515e0367ee2718b2f360ef0194663d23a91236910d5f4a90ac4d745a4f2'},
+            'emscripten_release_hash': 'c2655005234810c7c42e02a18e4696554abe0352',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '3.1.74'},
+            'llvm_major_estimate': 20,
+            'llvm_version_estimate': '20.0.0',
+            'llvm_commit_hash': '322eb1a92e6d4266184060346616fa0dbe39e731',
+            'llvm_commit_date': '2024-12-10'},
+ '4.0.0': {'binary_checksums': {'sha_linux': '6836988f0b7ee6ce3df5192dd4375b9eee55be78847ce31cf1d2abfb00f1e991',
+                                'sha_linux_arm64': 'd4e6e04b7e2fa1bdffc9c07ab4e0a3f66bde75adb06ebf9cc66a341907b17db4',
+                                'sha_mac': '4123e9ff6a699dac303c4fe22529ae0d618c118fcd8267df590363b0fc98c91d',
+                                'sha_mac_arm64': '4b5fb7cc4f5f8526aaa41c8560a00ad6782b97cd3894d856beb635f05a825613',
+                                'sha_win': '6b1e5aee4b4a4274712566c845888bdf4eced09a5aaa64c1796cda57cd2854c4'},
+           'emscripten_release_hash': '3ebc04a3dab24522a5bf8ced3ce3caea816558f6',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.0'},
+           'llvm_major_estimate': 20,
+           'llvm_version_estimate': '20.0.0',
+           'llvm_commit_hash': '322eb1a92e6d4266184060346616fa0dbe39e731',
+           'llvm_commit_date': '2024-12-10'},
+ '4.0.1': {'binary_checksums': {'sha_linux': '7b2b64b1bc15555696f78cbcb54c8d75832222d1578270ff5f56a8024c9a0dbc',
+                                'sha_linux_arm64': '5c046a22b933de14be6b2522b75796afffe3940a19422eee483b7f3f1a226d66',
+                                'sha_mac': 'd089eba9c3cad675bbd7d3318aec166ebe5ba984a6c5291136c09c68324d9818',
+                                'sha_mac_arm64': 'c8359b334bad71719e8d29e796ca7b63891e0305987b2572eb5a2f020e34f773',
+                                'sha_win': '9cf861339327f3657281c5c8c18aa723323acffe3b3d1c3807b9d4576d097e0e'},
+           'emscripten_release_hash': '5ff495a591978fdf8a16f2d172be3616f3150d1e',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.1'},
+           'llvm_major_estimate': 20,
+           'llvm_version_estimate': '20.0.0',
+           'llvm_commit_hash': None,
+           'llvm_commit_date': None},
+ '4.0.2': {'binary_checksums': {'sha_linux': '3c0e3940240709388c24a4262680c18bb1d5979f2337abe53db00fb039606c44',
+                                'sha_linux_arm64': '21ed0c31c1fc972e3509fcb140e0323061b5f2b173fe56d1f8961df2a37e4c11',
+                                'sha_mac': 'e1bd96ec790968adf583d348158375b76ee0287e348954c3393c82565475b07b',
+                                'sha_mac_arm64': 'e5bf9a5efabc114b42636abcea07a1e02d3a9406cd399a29ccbc730586dce465',
+                                'sha_win': '78010f8e2f7bb6868bb20e3fc32e24d45e6fca749c388c2d25bea9845512338d'},
+           'emscripten_release_hash': 'cc8eba40de8235f9c33d92463018f87b3edaa09e',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.2'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': '9534d27e3321a3b9e6e79fe6328445575bf26b7b',
+           'llvm_commit_date': '2025-01-29'},
+ '4.0.3': {'binary_checksums': {'sha_linux': '6480f51d0c24130424c696bf83e9774f42246a0109c8d48b59f4520fdfadb928',
+                                'sha_linux_arm64': '76b1511d550b4f47276b93581ae5122063acbca7c960703637657388cf178636',
+                                'sha_mac': 'f40851b816b31b3ca3214ebf61cc152625a05c24f43e2b13c2ad9b9e5dca73c0',
+                                'sha_mac_arm64': '6d8ac5ad1f59f71de0927eb2c595dab2f21d9946ca293434359a6db2ab06a138',
+                                'sha_win': '3702e4a518057520d4ad9e7cd63a01a829770d090551e00f19f417f55b0170d3'},
+           'emscripten_release_hash': 'de2109f0e5e7278d470da11de526aed16c527722',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.3'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': '6dc41a639334b913e762f65410fcd14a722b137f',
+           'llvm_commit_date': '2025-02-06'},
+ '4.0.4': {'binary_checksums': {'sha_linux': 'f05dab4a6a13a5fe6972e95e918d1483e687faf468e1a653deaa8d7956a97a3a',
+                                'sha_linux_arm64': '95a421f304a7209c6f259754ad15aea5bbbbb1838139b51837aeb2c184fa4a89',
+                                'sha_mac': 'd8b44aae37224ae76572ad84b60a2adaa126826332864fb689944d5130705d8d',
+                                'sha_mac_arm64': 'ade1c1a0c2e5893c6f74079beeae8b7e2a0c3f3b7ae88891064104fd985dfc2b',
+                                'sha_win': '342cf9dfb83e95bf678d07e460e093ea61a609d34b4603d9be06d4f31784409d'},
+           'emscripten_release_hash': 'ea71afcf5a172125179a07ff1731de6e81c92222',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.4'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': '148111fdcf0e807fe74274b18fcf65c4cff45d63',
+           'llvm_commit_date': '2025-02-25'},
+ '4.0.5': {'binary_checksums': {'sha_linux': 'fdd4d9d6b37e845039b207baaef60cd98fb594ea13a3e6d622c2dcd8f2a48ac6',
+                                'sha_linux_arm64': '0007aec32eee609b91f35c32481ec060ea7dac7151e36344bbcae419907f9240',
+                                'sha_mac': 'f4e5a6c57ad9de59bff73463972213a299af2bb419dafbdd3959947fa801a342',
+                                'sha_mac_arm64': 'b8b93190fa17afe32a5eaa7120b807767b1c9d6e1d4ae6b9a2c6adb231758683',
+                                'sha_win': '3b8ed9e298a6d58fee841f5c3f1d3e7b2dff104cc7df314cd329f4c05d470be0'},
+           'emscripten_release_hash': 'd7f8ff5e2ca3539c33fae81e98f7c56ef9fa1239',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.5'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': None,
+           'llvm_commit_date': None},
+ '4.0.6': {'binary_checksums': {'sha_linux': '27fc220a9ad98d323cad73531ff563e9838c9e1205f51ee2a5632bb4266a35d2',
+                                'sha_linux_arm64': '2d03f8eb3f81dd94821658eefbb442a92b0b7601f4cfb08590590fd7bc467ef8',
+                                'sha_mac': 'c06048915595726fc2e2da6a8db3134581a6287645fb818802a9734ff9785e77',
+                                'sha_mac_arm64': '35d743453d0f91857b09f00d721037bb46753aaeae373bd7f64746338db11770',
+                                'sha_win': '3b576e825b26426bb72854ed98752df3fcb58cc3ab1dc116566e328b79a8abb3'},
+           'emscripten_release_hash': '14767574a5c37ff9526a253a65ddbe0811cb3667',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.6'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': '4775e6d9099467df9363e1a3cd5950cc3d2fde05',
+           'llvm_commit_date': '2025-03-26'},
+ '4.0.7': {'binary_checksums': {'sha_linux': '60079078b1ecc4e96ab01c4189aceeff9049a1bb2544123295e9841b91a9410d',
+                                'sha_linux_arm64': 'caa10ae2d2b01eb290957e96636f0a6861e7305c8d991c762379542208415793',
+                                'sha_mac': 'd588cc31b7db0d876f1d45f4d0c656d5e205d049c0bb27209cad04cfebe19309',
+                                'sha_mac_arm64': 'c0153cc053d8961e094447c3e706cb8f379c263bee64202fd78251fe018fb014',
+                                'sha_win': '7974b6e11164c2c94ddb252c9728d21de321094421f5d0856702e65c06751e54'},
+           'emscripten_release_hash': 'ef4e9cedeac3332e4738087567552063f4f250d3',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.7'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': '57025b42c43b2f14f7e58692bc19cd53d1b8a45e',
+           'llvm_commit_date': '2025-04-15'},
+ '4.0.8': {'binary_checksums': {'sha_linux': '7b50b2b40f80d4531ae29a0a5b902eca41552e04815f59880a122ac81e8f269d',
+                                'sha_linux_arm64': 'd6e3ab0cdec2e6983235322f600f248d313bfce4a6a69ef16cdfdc330ff748b8',
+                                'sha_mac': 'e1b2e6d4797338ed884f9d8a8419f93fc42cfcdea5e8a8b29fe13c6fd3fe7f7a',
+                                'sha_mac_arm64': '115b207304d5471b77fc7649904111f3bb5ed7998ad192cba6cfc5fd0b2d78cb',
+                                'sha_win': '9ca65cb49287f448216c2eac12dacff9808ae827d5de267aaf2bd65f6d4f233e'},
+           'emscripten_release_hash': '56f86607aeb458086e72f23188789be2ee0e971a',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.8'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': None,
+           'llvm_commit_date': None},
+ '4.0.9': {'binary_checksums': {'sha_linux': 'c6fd245138e6bbdd8349963cb4045c557d657e4be0ea44155375633c689c8be9',
+                                'sha_linux_arm64': '872d7f5870f1bfc523a446ca66ab1b47009a96be33c398dbbb12a56597e46ab5',
+                                'sha_mac': '7efb0a6ddcb915aeca9f8685db909ae7799452894876fc1223a78d5c3288ff2d',
+                                'sha_mac_arm64': 'b97f3cda61211dd83b31ef9ea92e83d416a9422192cf3ee484fffe11e5d6e5b9',
+                                'sha_win': 'e6e409ae564c041691f2fecd690431a9935401f8ab6afe284b222546887e84c5'},
+           'emscripten_release_hash': 'cb2a69bce627bd2247624c71fc12907cb8785d2f',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.9'},
+           'llvm_major_estimate': 21,
+           'llvm_version_estimate': '21.0.0',
+           'llvm_commit_hash': '2f05451198e2f222ec66cec4892ada0509519290',
+           'llvm_commit_date': '2025-05-17'},
+ '4.0.10': {'binary_checksums': {'sha_linux': '0183f887b56c3f8d4b45826cb49856a3324afb66236ad3c13944c0fd2550cbbc',
+                                 'sha_linux_arm64': '0679f459118d80163d0712b0abda00cbc97a90cddf1dcefa9efb1bf89f67baed',
+                                 'sha_mac': '02f3179f703b4d196a679897b430c1eeeb1d5f9aeba9b435b04ba3f526f7e8e0',
+                                 'sha_mac_arm64': 'c744ffe06ffed55cd8dae42862b7646f15550c7decd47a48d09a474af83732b0',
+                                 'sha_win': '1a66825e85fda039f57d39c98ae2bdb96a18e53745159e9599f69679be18439f'},
+            'emscripten_release_hash': '8103ffedfb0c42d231c6af6859a5a1a832260b43',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.10'},
+            'llvm_major_estimate': 21,
+            'llvm_version_estimate': '21.0.0',
+            'llvm_commit_hash': None,
+            'llvm_commit_date': None},
+ '4.0.11': {'binary_checksums': {'sha_linux': 'f38e70b53be587e7c757f375b3452e259c70130d4b40db3213c95b7ae321f5d7',
+                                 'sha_linux_arm64': '42020e4db200ac366a3e91ac2fccc04ee0ffc090cd2d5986c892b27f39172bb9',
+                                 'sha_mac': '4169811f9682f54ae5c9d0662d0a4dd4318abab5d3d0473fa54007f515a8cdea',
+                                 'sha_mac_arm64': '09554371e3941306d047d67618532e5366ba6c9b5bda1a504a917bfbabc5d414',
+                                 'sha_win': 'bd2094ca9bde5df25020a46ece7f56b622d1d22214fbd12950b01b952dd40084'},
+            'emscripten_release_hash': '7033fec38817ec01909b044ea0193ddd5057255c',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.11'},
+            'llvm_major_estimate': 21,
+            'llvm_version_estimate': '21.0.0',
+            'llvm_commit_hash': '0f0079c29da4b4d5bbd43dced1db9ad6c6d11008',
+            'llvm_commit_date': '2025-07-11'},
+ '4.0.12': {'binary_checksums': {'sha_linux': '1c303712707a91b88f743b0ad6dd1544c289e614844396698a2510a66c5608f1',
+                                 'sha_linux_arm64': '2c503d031d2ad2b13c6e4fe09f104fe50c5d1319feaa2b3d19d4e4608435fbb8',
+                                 'sha_mac': 'c85830f151ec8eebec6bb2344e3eed942bc7b5dc91b146326635f9f71af459f2',
+                                 'sha_mac_arm64': '853dff1a8451b54ff7cdd95f923851dd9b58ab36873b7b600d16243a5fb6d907',
+                                 'sha_win': '7b7e58fbd35a78ddf9a2a4a3f6215857bf2342942c429cdf540a2251540cb845'},
+            'emscripten_release_hash': '209b886304498eff50dd835850dc5715803401ed',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.12'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '7f93487862d98bf1c168babba87daf6224d8a46f',
+            'llvm_commit_date': '2025-07-31'},
+ '4.0.13': {'binary_checksums': {'sha_linux': '2ad887035e3e5cac78abcaeca3b3881897f03b9919d008cbc0ef41d7641247c9',
+                                 'sha_linux_arm64': '675156bd626c7b19d4f2271ea8ffa77a235d9b0a031116632e53b374cf23754c',
+                                 'sha_mac': '657cbd01e84f0a33cb7a1379baecd18a7d96883222a3a99b43919d8bb2374f55',
+                                 'sha_mac_arm64': '12ac26e298ef973207eba9332e28da375ec2ba1d32e68e0d8b32de3c886a2e39',
+                                 'sha_win': 'a363d6e92dcaf0024d378f1faabb61a139d9152a796f66a475a48e33e90f6adb'},
+            'emscripten_release_hash': '32b8ae819674cb42b8ac2191afeb9571e33ad5e2',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.13'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '177f27d22092cb64e871e6cd2f8981d24e823186',
+            'llvm_commit_date': '2025-08-14'},
+ '4.0.14': {'binary_checksums': {'sha_linux': '4f83b1ef38c4d4c6df1ad6d9ae9970fb1f4bda7342c5860868d1825f4460b27c',
+                                 'sha_linux_arm64': 'ddb831fd4ba096d58c638f44a887f7dcb925d3a1befc95d43c69db5ad3c2d81b',
+                                 'sha_mac': '2e73d422b5fd54cfe188151fe4a19651fdad2d47614d1d7eee5adc124cfc2dc9',
+                                 'sha_mac_arm64': '4e01d07b379257e30e6daf61d171015e578a5eb004c7113eda964b181313c4b0',
+                                 'sha_win': 'b67f5027dd9f9e51bdcf0b8bd2da5203a45b4b3338a0e288ee43e186375a91ae'},
+            'emscripten_release_hash': '4658718c188782acc67a249d45fce2d891ee3cc1',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.14'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '1cc84bcc08f723a6ba9d845c3fed1777547f45f9',
+            'llvm_commit_date': '2025-09-02'},
+ '4.0.15': {'binary_checksums': {'sha_linux': 'c0ed25c30e1d747072de0c9053cde27ca83a8d2424e8bc6b7d39dccf42fcba35',
+                                 'sha_linux_arm64': '1e250570d0ea7a3112f65ca0f31031793aa836d968dfc88323b7826d737c1b81',
+                                 'sha_mac': 'b34bb7fb7a49fe9427a62521685980cc8739a290cdbbba9b00bdb581338b2111',
+                                 'sha_mac_arm64': '1669390cc812bdebc234f3ce7e5c2f90076e5b6ca52a0822be52d5638b15a380',
+                                 'sha_win': '726046170075416370af4f13276990dde9560a844c14ece74912fce6fffd03da'},
+            'emscripten_release_hash': 'b412b6307e541b93dd93f01b61181e15c17302ec',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.15'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '3388d40684742e950b3c5d1d2dafe5a40695cfc1',
+            'llvm_commit_date': '2025-09-16'},
+ '4.0.16': {'binary_checksums': {'sha_linux': 'c1ad0e9259eec965eb9724bbe5ca3fce45939da58d840f9eda71c52f83447561',
+                                 'sha_linux_arm64': '295cd1406ac584c92ce58f01ad2ae813893932c26eb7201caaeca45d3c6f8a9d',
+                                 'sha_mac': 'ee29be60e98ea37446b839dc46049c04a7efce7b60b7737423d36051dbb630b2',
+                                 'sha_mac_arm64': 'f8d06789195f0c3b07d7f241b11f2aed9099f3e3ba69dd0fb85a93b9edcfec45',
+                                 'sha_win': 'e3cc92b6b55604fd9c2017a7659cd5ecc234e9522f9bfccb1454130c6189e309'},
+            'emscripten_release_hash': 'e68ea3dc5ca3eda4e2bba62359b033074e506925',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.16'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': None,
+            'llvm_commit_date': None},
+ '4.0.17': {'binary_checksums': {'sha_linux': '5e4269ab4d4dd97da93f2833bb97780ef6ddee9a7325d345587bddf8890d89aa',
+                                 'sha_linux_arm64': '2ca54b47a73f1f6687e33b3494748f52d753e2e21b9db505e358d362da4794bb',
+                                 'sha_mac': 'd574a26c775b4f737a6960871340b4cdb04eefe44f6fd3a5072c62e86837c1fe',
+                                 'sha_mac_arm64': '8a571a73461d7755787fc5ffb35b7284216741cfbbcf52d855d54d2cc36ecb9e',
+                                 'sha_win': 'a394e719b3258ca7502cb85c9f1031b356ec41f511a187f79bb50b91678aae75'},
+            'emscripten_release_hash': '41d2106c68c28e101e6252a48e22c78b07722508',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.17'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '997560090e791558ca41ff3e5f4eec717102046c',
+            'llvm_commit_date': '2025-10-17'},
+ '4.0.18': {'binary_checksums': {'sha_linux': '38148e69fd718e81de6edc3bc03b1851da436b145caa3c90544f128279eaac75',
+                                 'sha_linux_arm64': '9b86ffc6185d4367718d679db2bcc0dadb64f8caffbfadf3db93d9d1ae5ab34c',
+                                 'sha_mac': 'c6ab987445e37632202253b15b871628385f281e85d54a36a4f7357fd3a3f4bb',
+                                 'sha_mac_arm64': '762cda293d5737414c12d0a1d09e765d22dea3944c032aa56d98d3a37abc02ea',
+                                 'sha_win': 'c80405bd2898051de00869f31568c3217ebc8d9cba33a18f8c01e8bb3c4b4f7b'},
+            'emscripten_release_hash': 'df7d4d811503e86e7728326e3eabbc383cb8042d',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.18'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': None,
+            'llvm_commit_date': None},
+ '4.0.19': {'binary_checksums': {'sha_linux': 'f83aa5ee648a4591ddbfcbd19a3040056c9c5a846adb2b9c342b37f2dd557f82',
+                                 'sha_linux_arm64': '75c040b3463e58ba1fc15c18878327ef678a5f64621378cf2899aa4cf54c1dab',
+                                 'sha_mac': 'b6492abede5c1569d46044e750ed20e3e081e8a1c480913892cf5b9d84a5027c',
+                                 'sha_mac_arm64': '5e522c7c03b83929a1d2a2321d8e5cc8fe3d0f0aeb05d1d26213b52008494731',
+                                 'sha_win': '39078e88c6d29e6a09892df2d6440df4f47f78292377b89174ea209b1188a6f9'},
+            'emscripten_release_hash': '8b01e2ec3f33e6b94842096d7312ce4ef5f33f6c',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.19'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '12f392cff10fcc70b4ec4f01ab386922742e9136',
+            'llvm_commit_date': '2025-11-04'},
+ '4.0.20': {'binary_checksums': {'sha_linux': 'a06e7ddda0c168f7ad52e6e0509c98db3545dcb254d3b9052e9e6b8423eaee7d',
+                                 'sha_linux_arm64': 'a42862782c1d23330d2f55936e451f54ed4a630f9d7430ffd1936dc6967a29d1',
+                                 'sha_mac': '6c4e8445a8e47e55fcd99789ec023d614c8dbd916afe64e9feb7a292c5070cd2',
+                                 'sha_mac_arm64': '144433e905ec1db726df9128e99624b9b4a3716e96dfb37dde22e2294a675c07',
+                                 'sha_win': '388e9fab2bc9f94e85b1541e6ae0f1d9a5b9dfa9d756d89a0a3fc7acc052fbd5'},
+            'emscripten_release_hash': 'c387d7a7e9537d0041d2c3ae71b7538cc978104e',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.20'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': None,
+            'llvm_commit_date': None},
+ '4.0.21': {'binary_checksums': {'sha_linux': 'e8516b903cd4dc16bf5aa2aacd826adcff5ff1d97d3d88e5e3871decd94cd8b2',
+                                 'sha_linux_arm64': '415024a22f84424c713b117c3a24cefb98ec03737e02063074010fdc8eaeb334',
+                                 'sha_mac': 'f17989b3528cd14971fe75ae9b2aa7d8cc4cc5bbb6d408660e059f822e108a46',
+                                 'sha_mac_arm64': '7960d8d33243f2f7acdac157136c6e93680550361ed71bb225fcfa25b6bbb2fb',
+                                 'sha_win': '79b3a6b77cf8015cc07ad25353f17f1828e731b0d8757a046071fffbdd5aaf70'},
+            'emscripten_release_hash': 'd70a5da89b3e673bf6a482724478fc17e81e575e',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.21'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': '60513b8d6ebacde46e8fbe4faf1319ac87e990e3',
+            'llvm_commit_date': '2025-12-01'},
+ '4.0.22': {'binary_checksums': {'sha_linux': '81219e78defb2f46d12a67a2fa6d128344d850f1e4375b173a324036236b40ef',
+                                 'sha_linux_arm64': '5bff19114edb410863634b14e3f459e7d90dc5339f7e5c7bdd5a946356b1dd54',
+                                 'sha_mac': 'a40cfb7c4c4f8cac9c6521475abca80f20986c8c438d46ac745bb4316d838a30',
+                                 'sha_mac_arm64': '1a3fb183385682e790cf617824681dc72c2b30e8db2afc9189d0dadea9ccd466',
+                                 'sha_win': '4a29b0bdc3d477ce39a9e6cd508f16dc19ea1bf861a66c1d715e0264ab550e45'},
+            'emscripten_release_hash': 'bebaf7e50e31865b0724f17eaa52e161e2dfef5a',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.22'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': 'c7706d9472fe880ba1d3418919ad4185710c9559',
+            'llvm_commit_date': '2025-12-17'},
+ '4.0.23': {'binary_checksums': {'sha_linux': '5f1565fe45a1223cedf3b0300f5089c2c64954d2895b2aaedc85043c719be965',
+                                 'sha_linux_arm64': 'd8ed075930b397d3aed8a1c7558db1918ade786349b07d5c042dfa7f65f78563',
+                                 'sha_mac': '5823ef26fd45b5a960960fb53026513d43922eac7a1e3ba12d1344d7a94699f9',
+                                 'sha_mac_arm64': '54234e108d6612eca5dc9280d1779ccec3d49ad4d8c8562a6b2046b0a5a8d5d4',
+                                 'sha_win': 'c2e1b9a2eed20f9d5903780b559ce2b384132713f07936512e6d962dd5a5dae6'},
+            'emscripten_release_hash': 'aaa43392544d695232b70eda706d751f18980c2a',
+            'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '4.0.23'},
+            'llvm_major_estimate': 22,
+            'llvm_version_estimate': '22.0.0',
+            'llvm_commit_hash': None,
+            'llvm_commit_date': None},
+ '5.0.0': {'binary_checksums': {'sha_linux': 'ba97bdf3737d19f70af390223eb6262013b89206202779b6a8d57568b3241a59',
+                                'sha_linux_arm64': 'd3e0a648d1d8a33908e8f1d0878b62ec10f3714c13045f29c720e3936a1c411c',
+                                'sha_mac': '5020626bc87d3a9634bfa63fda05aa44f74144a849453c9cf1f014d9fdc63a5d',
+                                'sha_mac_arm64': '7172745de73be538e86680ae04856f8608370c971f5f21bb5cf1d6331c83ef6a',
+                                'sha_win': '660fcee6fff5042ca4b535f6100319303be399ca86c393266da09e709944915b'},
+           'emscripten_release_hash': 'e44d3cc557d78155966478aa2bd8dec657609619',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '5.0.0'},
+           'llvm_major_estimate': 23,
+           'llvm_version_estimate': '23.0.0',
+           'llvm_commit_hash': '358db292cc6a9a8a5448a296f643312289f328d7',
+           'llvm_commit_date': '2026-01-23'},
+ '5.0.1': {'binary_checksums': {'sha_linux': 'bda6917b630fcc604cca39af433180adfd7195e378075331ceac926553684249',
+                                'sha_linux_arm64': '050cb3e926187ade7a08ff3e58dd1fae7f4d84c540f9e0e0b008b562ad8922db',
+                                'sha_mac': 'c3779aedbed7c860aeedc098deffaa351cb5da490dd17bd48d37715fdb4fe07a',
+                                'sha_mac_arm64': '76bcc261810a6facb482c6314711c7bb429ad52f7ed0af6285a278478aa27f21',
+                                'sha_win': '68765c3eca68b715772cf84963371448480d034cfbbcdc54dc7379786cb4e71c'},
+           'emscripten_release_hash': 'bf32ae8b61ac8efeb7eca01b54c8307f992724f7',
+           'llvm_inference': {'mode': 'binary-verified', 'anchor_release': '5.0.1'},
+           'llvm_major_estimate': 23,
+           'llvm_version_estimate': '23.0.0',
+           'llvm_commit_hash': None,
+           'llvm_commit_date': None}}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Compile emsdk-llvm-map.json into a Python module for resolve_emsdk_for_llvm.py.
+
+The module holds the two tables the resolver reads as literal dicts, so they
+load from the bytecode cache instead of being parsed from JSON on every run.
+generate_emsdk_llvm_map.py re-runs this whenever it rewrites the repository
+map. The resolver ignores the module (and parses the JSON) unless the recorded
+source size and sha256 both match the map file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import pprint
+from pathlib import Path
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_MAP_PATH = SCRIPT_DIR.parent / "emsdk-llvm-map.json"
+DEFAULT_OUTPUT = SCRIPT_DIR / "emsdk_map_data.py"
+
+
+def write_map_module(map_path: Path, output: Path) -> None:
+    """Write the policy/releases tables of ``map_path`` as a module at ``output``."""
+    data = map_path.read_bytes()
+    payload = json.loads(data)
+    policy = payload.get("flang_major_to_prev_llvm_major_latest_emsdk", {})
+    releases = payload.get("releases", {})
+
+    def fmt(value: dict) -> str:
+        return pprint.pformat(value, width=100, sort_dicts=False)
+
+    output.write_text(
+        '"""Generated by scripts/gen_emsdk_map_py.py from emsdk-llvm-map.json. Do not edit."""\n'
+        "\n"
+        f"SOURCE_SIZE = {len(data)}\n"
+        f'SOURCE_SHA256 = "{hashlib.sha256(data).hexdigest()}"\n'
+        "\n"
+        f"POLICY = {fmt(policy)}\n"
+        "\n"
+        f"RELEASES = {fmt(releases)}\n",
+        encoding="utf-8",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--map-file", default=str(DEFAULT_MAP_PATH), help="Path to emsdk-llvm-map.json"
+    )
+    parser.add_argument(
+        "--output", default=str(DEFAULT_OUTPUT), help="Path to write the generated module."
+    )
+    args = parser.parse_args()
+
+    write_map_module(Path(args.map_file), Path(args.output))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,15 @@ from __future__ import annotations
 import argparse
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from _http_cache import GITHUB_TOKEN, fetch_bytes
+from gen_emsdk_map_py import DEFAULT_MAP_PATH, DEFAULT_OUTPUT, write_map_module
 
 
 EMSDK_TAGS_URL = (
@@ -30,14 +35,27 @@ EMSCRIPTEN_CHANGELOG_URL = (
     "https://raw.githubusercontent.com/emscripten-core/emscripten/main/ChangeLog.md"
 )
 
+FETCH_HEADERS = {
+    "Accept": "application/vnd.github.raw",
+    "User-Agent": "flang-releases-emsdk-map-generator",
+}
+if GITHUB_TOKEN:
+    FETCH_HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+
 SEMVER_ONLY_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+# a release header line followed by a dashed underline line
 SECTION_HEADER_RE = re.compile(
-    r"^(\d+)\.(\d+)\.(\d+)(?:\s*\(.*\))?(?:\s*-\s*\d{2}/\d{2}/\d{2})?\s*$"
+    r"^[ \t]*(\d+)\.(\d+)\.(\d+)(?:[ \t]*\(.*\))?(?:[ \t]*-[ \t]*\d{2}/\d{2}/\d{2})?[ \t]*\r?\n"
+    r"[ \t]*-+[ \t]*\r?$",
+    re.MULTILINE,
+)
+# [^\S\n] keeps matches within one line when sections are scanned as a block
+LLVM_VERSION_RE = re.compile(r"LLVM[^\S\n]+(\d+)\.(\d+)\.(\d+)")
+REVISION_BLOCK_RE = re.compile(
+    r'"(\d+\.\d+\.\d+)":\s*struct\(\s*(.*?)\s*\),', re.DOTALL
 )
-LLVM_VERSION_RE = re.compile(r"LLVM\s+(\d+)\.(\d+)\.(\d+)")
-REVISION_START_RE = re.compile(r'^\s*"(\d+\.\d+\.\d+)": struct\(\s*$')
 REVISION_FIELD_RE = re.compile(
-    r'^\s*(hash|sha_linux|sha_linux_arm64|sha_mac|sha_mac_arm64|sha_win)\s*=\s*"([0-9a-f]+)",\s*$'
+    r'\b(hash|sha_linux|sha_linux_arm64|sha_mac|sha_mac_arm64|sha_win)\s*=\s*"([0-9a-f]+)"'
 )
 
 
@@ -62,15 +80,7 @@ class SemVer:
 
 
 def fetch_text(url: str) -> str:
-    req = Request(
-        url,
-        headers={
-            "Accept": "application/vnd.github.raw",
-            "User-Agent": "flang-releases-emsdk-map-generator",
-        },
-    )
-    with urlopen(req, timeout=60) as resp:
-        return resp.read().decode("utf-8")
+    return fetch_bytes(Request(url, headers=FETCH_HEADERS), timeout=60).decode("utf-8")
 
 
 def parse_emsdk_release_hashes(tags_json_text: str) -> Dict[str, str]:
@@ -84,66 +94,36 @@ def parse_emsdk_release_hashes(tags_json_text: str) -> Dict[str, str]:
 
 
 def parse_revisions_bzl(revisions_text: str) -> Dict[str, Dict[str, str]]:
-    out: Dict[str, Dict[str, str]] = {}
-    current_release: Optional[str] = None
-    current_fields: Dict[str, str] = {}
-
-    for raw in revisions_text.splitlines():
-        if current_release is None:
-            m = REVISION_START_RE.match(raw)
-            if m:
-                current_release = m.group(1)
-                current_fields = {}
-            continue
-
-        field_match = REVISION_FIELD_RE.match(raw)
-        if field_match:
-            current_fields[field_match.group(1)] = field_match.group(2)
-            continue
-
-        if raw.strip() == "),":
-            out[current_release] = current_fields
-            current_release = None
-            current_fields = {}
-
-    return out
+    return {
+        m.group(1): dict(REVISION_FIELD_RE.findall(m.group(2)))
+        for m in REVISION_BLOCK_RE.finditer(revisions_text)
+    }
 
 
-def is_section_underline(line: str) -> bool:
-    stripped = line.strip()
-    return bool(stripped) and all(ch == "-" for ch in stripped)
-
-
-def parse_changelog_sections(changelog_text: str) -> Dict[str, List[str]]:
-    lines = changelog_text.splitlines()
-    headers: List[Tuple[int, str]] = []
-    i = 0
-    while i < len(lines) - 1:
-        header_match = SECTION_HEADER_RE.match(lines[i].strip())
-        if header_match and is_section_underline(lines[i + 1]):
-            semver = (
-                f"{header_match.group(1)}."
-                f"{header_match.group(2)}."
-                f"{header_match.group(3)}"
-            )
-            headers.append((i, semver))
-            i += 2
-            continue
-        i += 1
+def parse_changelog_sections(changelog_text: str) -> Dict[str, Tuple[int, int]]:
+    """Locate per-release sections of the ChangeLog.
 
-    sections: Dict[str, List[str]] = {}
-    for idx, (line_no, semver) in enumerate(headers):
-        body_start = line_no + 2
-        body_end = headers[idx + 1][0] if idx + 1 < len(headers) else len(lines)
-        sections[semver] = lines[body_start:body_end]
+    Returns, per release, the ``[start, end)`` character range of its body in
+    ``changelog_text``; the text is never split into lines or copied.
+    """
+    headers = list(SECTION_HEADER_RE.finditer(changelog_text))
+    sections: Dict[str, Tuple[int, int]] = {}
+    for idx, header in enumerate(headers):
+        semver = f"{header.group(1)}.{header.group(2)}.{header.group(3)}"
+        body_end = (
+            headers[idx + 1].start() if idx + 1 < len(headers) else len(changelog_text)
+        )
+        sections[semver] = (header.end(), body_end)
     return sections
 
 
-def highest_llvm_version_in_section(section_lines: List[str]) -> Optional[SemVer]:
-    found: List[SemVer] = []
-    for line in section_lines:
-        for m in LLVM_VERSION_RE.finditer(line):
-            found.append(SemVer(int(m.group(1)), int(m.group(2)), int(m.group(3))))
+def highest_llvm_version_in_section(
+    changelog_text: str, start: int, end: int
+) -> Optional[SemVer]:
+    found = [
+        SemVer(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        for m in LLVM_VERSION_RE.finditer(changelog_text, start, end)
+    ]
     if not found:
         return None
     return max(found)
@@ -164,47 +144,33 @@ def infer_branch_versions(
 
     out: Dict[str, Tuple[Optional[SemVer], Optional[str], str]] = {}
 
-    for branch, versions in by_branch.items():
+    for versions in by_branch.values():
         versions_sorted = sorted(versions, key=lambda x: x.patch)  # ascending patch
-        assigned: Dict[str, Tuple[Optional[SemVer], Optional[str], str]] = {}
+        # releases before the first explicit mention inherit it (backward fill)
+        first_known = next(
+            (
+                (key, section_explicit[key])
+                for key in map(str, versions_sorted)
+                if section_explicit.get(key) is not None
+            ),
+            None,
+        )
 
         current_version: Optional[SemVer] = None
         current_anchor: Optional[str] = None
-
-        first_known_index: Optional[int] = None
-        first_known_version: Optional[SemVer] = None
-        first_known_anchor: Optional[str] = None
-
-        for idx, sv in enumerate(versions_sorted):
+        for sv in versions_sorted:
             key = str(sv)
             explicit = section_explicit.get(key)
             if explicit is not None:
                 current_version = explicit
                 current_anchor = key
-                if first_known_index is None:
-                    first_known_index = idx
-                    first_known_version = explicit
-                    first_known_anchor = key
-                assigned[key] = (explicit, key, "explicit")
-                continue
-
-            if current_version is not None:
-                assigned[key] = (current_version, current_anchor, "forward_fill")
+                out[key] = (explicit, key, "explicit")
+            elif current_version is not None:
+                out[key] = (current_version, current_anchor, "forward_fill")
+            elif first_known is not None:
+                out[key] = (first_known[1], first_known[0], "backward_fill")
             else:
-                assigned[key] = (None, None, "unknown")
-
-        if first_known_index is not None and first_known_version is not None:
-            for idx in range(first_known_index):
-                key = str(versions_sorted[idx])
-                assigned[key] = (
-                    first_known_version,
-                    first_known_anchor,
-                    "backward_fill",
-                )
-
-        for sv in versions_sorted:
-            key = str(sv)
-            out[key] = assigned[key]
+                out[key] = (None, None, "unknown")
 
     return out
 
@@ -270,17 +236,22 @@ def main() -> None:
         raise SystemExit("--flang-major-range must be ascending, e.g. 19-23")
     min_emsdk_version = SemVer.parse(args.min_emsdk_version)
 
-    tags_text = fetch_text(EMSDK_TAGS_URL)
-    revisions_text = fetch_text(EMSDK_REVISIONS_URL)
-    changelog_text = fetch_text(EMSCRIPTEN_CHANGELOG_URL)
+    # the three fetches are latency-bound; overlap their round trips
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tags_text, revisions_text, changelog_text = executor.map(
+            fetch_text,
+            [EMSDK_TAGS_URL, EMSDK_REVISIONS_URL, EMSCRIPTEN_CHANGELOG_URL],
+        )
 
     release_hashes = parse_emsdk_release_hashes(tags_text)
     revision_rows = parse_revisions_bzl(revisions_text)
     changelog_sections = parse_changelog_sections(changelog_text)
 
     section_explicit: Dict[str, Optional[SemVer]] = {}
-    for release, section_lines in changelog_sections.items():
-        section_explicit[release] = highest_llvm_version_in_section(section_lines)
+    for release, (start, end) in changelog_sections.items():
+        section_explicit[release] = highest_llvm_version_in_section(
+            changelog_text, start, end
+        )
 
     inferred = infer_branch_versions(section_explicit)
 
@@ -338,11 +309,15 @@ def main() -> None:
         "releases": releases,
     }
 
+    # json.dump issues one write per encoder chunk; encode once, write once
     with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
-        f.write("\n")
+        f.write(json.dumps(payload, indent=2, sort_keys=True) + "\n")
 
     print(f"Wrote {args.output}")
+    # keep the resolver's precompiled tables in step with the repository map
+    if Path(args.output).resolve() == DEFAULT_MAP_PATH:
+        write_map_module(DEFAULT_MAP_PATH, DEFAULT_OUTPUT)
+        print(f"Wrote {DEFAULT_OUTPUT}")
     print("llvm_major_latest_emsdk:", json.dumps(llvm_major_map, sort_keys=True))
     print(
         "flang_major_to_prev_llvm_major_latest_emsdk:",
@@ -6,14 +6,18 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+
 def sha256sum(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             digest.update(chunk)
     return digest.hexdigest()
 
@@ -49,13 +53,19 @@ def main() -> None:
     if not payload_artifacts:
         raise SystemExit("No release payload artifacts found (.tar.gz/.zip).")
 
+    # hashlib releases the GIL while hashing, so artifacts hash concurrently
+    with ThreadPoolExecutor() as executor:
+        digests = dict(
+            zip(payload_artifacts, executor.map(sha256sum, payload_artifacts))
+        )
+
     metadata_artifacts = []
     for path in payload_artifacts:
         metadata_artifacts.append(
             {
                 "name": path.name,
                 "size_bytes": path.stat().st_size,
-                "sha256": sha256sum(path),
+                "sha256": digests[path],
             }
         )
 
@@ -70,14 +80,15 @@ def main() -> None:
         "rebuild": args.rebuild.lower() == "true",
         "artifacts": metadata_artifacts,
     }
-    metadata_path.write_text(json.dumps(metadata, indent=2, sort_keys=True) + "\n")
-
-    checksum_targets = list(payload_artifacts)
-    checksum_targets.append(metadata_path)
-    lines = []
-    for path in sorted(checksum_targets, key=lambda p: p.name):
-        lines.append(f"{sha256sum(path)}  {path.name}")
-    sha256_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    metadata_bytes = (json.dumps(metadata, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    metadata_path.write_bytes(metadata_bytes)
+    # hash the bytes just written instead of reading the file back
+    digests[metadata_path] = hashlib.sha256(metadata_bytes).hexdigest()
+
+    checksums = bytearray()
+    for path in sorted(digests, key=lambda p: p.name):
+        checksums += f"{digests[path]}  {path.name}\n".encode("utf-8")
+    sha256_path.write_bytes(checksums)
 
 
 if __name__ == "__main__":
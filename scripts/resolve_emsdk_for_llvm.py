@@ -4,20 +4,42 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import re
 import sys
 from pathlib import Path
 
-
-LLVM_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+try:
+    # literal tables compiled from the JSON by gen_emsdk_map_py.py
+    import emsdk_map_data
+except ImportError:
+    emsdk_map_data = None
 
 
 def parse_major(version: str) -> int:
-    match = LLVM_VERSION_RE.match(version.strip())
-    if not match:
+    # X.Y.Z; isdecimal() accepts the same characters as a regex \d
+    parts = version.strip().split(".")
+    if len(parts) != 3 or not all(part.isdecimal() for part in parts):
         raise ValueError(f"Invalid LLVM version '{version}'. Expected X.Y.Z.")
-    return int(match.group(1))
+    return int(parts[0])
+
+
+def load_mapping(map_path: Path) -> tuple[dict, dict]:
+    """Return ``(policy, releases)`` from the mapping file."""
+    data = map_path.read_bytes()
+    # the precompiled tables are only used for the exact bytes they came from;
+    # the size check skips hashing a map that has obviously changed
+    if (
+        emsdk_map_data is not None
+        and len(data) == emsdk_map_data.SOURCE_SIZE
+        and hashlib.sha256(data).hexdigest() == emsdk_map_data.SOURCE_SHA256
+    ):
+        return emsdk_map_data.POLICY, emsdk_map_data.RELEASES
+    payload = json.loads(data)
+    return (
+        payload.get("flang_major_to_prev_llvm_major_latest_emsdk", {}),
+        payload.get("releases", {}),
+    )
 
 
 def main() -> None:
@@ -28,12 +50,10 @@ def main() -> None:
 
     llvm_major = parse_major(args.llvm_version)
     map_path = Path(args.map_file)
-    if not map_path.exists():
-        raise SystemExit(f"Mapping file not found: {map_path}")
-
-    payload = json.loads(map_path.read_text(encoding="utf-8"))
-    policy = payload.get("flang_major_to_prev_llvm_major_latest_emsdk", {})
-    releases = payload.get("releases", {})
+    try:
+        policy, releases = load_mapping(map_path)
+    except FileNotFoundError:
+        raise SystemExit(f"Mapping file not found: {map_path}") from None
 
     emsdk_release = policy.get(str(llvm_major))
     if not emsdk_release:
@@ -10,18 +10,69 @@ This script:
 """
 
 import argparse
+import mmap
 import os
 import re
-import subprocess
+import shutil
 import sys
-import tempfile
 from pathlib import Path
 
+# subprocess, tempfile and concurrent.futures are imported where they are
+# used, so --skip-* runs do not pay for the steps they skip (argparse
+# already loads re and shutil)
 
-def run(cmd, **kwargs):
-    """Run a command and return output."""
-    print(f"+ {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, **kwargs)
+
+def run(cmd, capture=False, **kwargs):
+    """Run an argv list, streaming its output as it is produced.
+
+    stderr always goes straight to ours. stdout does too unless ``capture`` is
+    set, in which case it is echoed line by line and returned in ``.stdout``.
+    """
+    import subprocess
+
+    cmd = [str(arg) for arg in cmd]
+    # resolve via PATH/PATHEXT so wrappers such as emcc.bat work without a shell
+    cmd[0] = shutil.which(cmd[0]) or cmd[0]
+    print(f"+ {subprocess.list2cmdline(cmd)}", flush=True)
+    try:
+        if not capture:
+            return subprocess.run(cmd, **kwargs)
+
+        lines = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, bufsize=1, **kwargs) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                lines.append(line)
+    except FileNotFoundError as exc:
+        # report a missing tool like the shell would, so callers print their FAIL
+        print(exc, file=sys.stderr)
+        return subprocess.CompletedProcess(cmd, 127, "" if capture else None, None)
+    sys.stdout.flush()
+    return subprocess.CompletedProcess(cmd, proc.returncode, "".join(lines), None)
+
+
+def submit_captured(executor, cmd):
+    """Start an argv list on ``executor`` with its output captured."""
+    import subprocess
+
+    cmd = [str(arg) for arg in cmd]
+    cmd[0] = shutil.which(cmd[0]) or cmd[0]
+
+    def job():
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True)
+        except FileNotFoundError as exc:
+            return subprocess.CompletedProcess(cmd, 127, "", str(exc))
+
+    return executor.submit(job)
+
+
+def wait_and_report(future):
+    """Wait for a ``submit_captured`` job, then print its command and output."""
+    import subprocess
+
+    result = future.result()
+    print(f"+ {subprocess.list2cmdline(result.args)}")
     if result.stdout:
         print(result.stdout)
     if result.stderr:
@@ -29,23 +80,66 @@ def run(cmd, **kwargs):
     return result
 
 
+# Group 1 captures the length/size width (b"i32"/b"i64") when the line
+# carries the exact signature checked below, so no second scan is needed
+OUTPUT_ASCII_LINE_RE = re.compile(
+    rb"^[^\n]*_FortranAioOutputAscii(?:\(ptr, ptr, (i32|i64)\))?[^\n]*", re.MULTILINE
+)
+MALLOC_LINE_RE = re.compile(
+    rb"^[^\n]*?(?:(?-i:declare ptr @malloc\((i32|i64)\))[^\n]*|malloc[^\n]*)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def grep_ir(path: Path, line_re):
+    """Scan an IR file for ``line_re`` in one mmap'd pass.
+
+    Returns the matching lines and the set of non-empty group(1) captures.
+    """
+    lines, widths = [], set()
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return lines, widths
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for m in line_re.finditer(mm):
+                lines.append(m.group(0).rstrip(b"\r").decode("utf-8", "replace"))
+                if m.group(1):
+                    widths.add(m.group(1))
+    return lines, widths
+
+
 def find_native_flang_rt_dir(install_dir: Path) -> Path:
     """Find the directory containing the native flang_rt library."""
-    # Look for libflang_rt.runtime.a or flang_rt.runtime.lib (Windows)
-    for pattern in ["**/libflang_rt.runtime.a", "**/flang_rt.runtime.static.lib"]:
-        matches = list(install_dir.glob(pattern))
-        if matches:
-            return matches[0].parent
-
-    # Fallback: look for any flang_rt file
-    for pattern in ["**/libflang_rt*", "**/flang_rt*"]:
-        matches = list(install_dir.glob(pattern))
-        if matches:
-            return matches[0].parent
+    # One walk checks every pattern; each "**" glob would re-walk the tree
+    fallback = None
+    for root, dirs, files in os.walk(install_dir):
+        for name in files:
+            # libflang_rt.runtime.a or flang_rt.runtime.static.lib (Windows)
+            if name in ("libflang_rt.runtime.a", "flang_rt.runtime.static.lib"):
+                return Path(root)
+        if fallback is None:
+            # Fallback: any flang_rt file
+            for name in files + dirs:
+                if name.startswith(("libflang_rt", "flang_rt")):
+                    fallback = Path(root)
+                    break
+
+    if fallback is not None:
+        return fallback
 
     raise FileNotFoundError(f"Could not find native flang_rt in {install_dir}")
 
 
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    # affinity respects cgroup/taskset CPU limits
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is unavailable on macOS and Windows
+        return os.cpu_count() or 4
+
+
 def find_script_dir() -> Path:
     """Find the directory containing this script."""
     return Path(__file__).resolve().parent
@@ -69,10 +163,11 @@ def main():
     flang = install_dir / "bin" / "flang-new"
     wasm32_runtime = build_dir / "libflang_rt.runtime.wasm32.a"
 
-    if not flang.exists():
+    # os.access checks existence and the executable bit in one syscall
+    if not os.access(flang, os.X_OK):
         # Try .exe for Windows
         flang = install_dir / "bin" / "flang-new.exe"
-        if not flang.exists():
+        if not os.access(flang, os.X_OK):
             print(f"Error: flang-new not found in {install_dir / 'bin'}")
             sys.exit(1)
 
@@ -97,15 +192,10 @@ def main():
         print("Step 1: Building wasm32 runtime library")
         print("=" * 60)
 
-        # Detect parallelism
-        try:
-            import multiprocessing
-            jobs = multiprocessing.cpu_count()
-        except:
-            jobs = 4
+        jobs = available_cpus()
 
         # Pass ROOT to make so it finds llvm-project and uses correct build dir
-        result = run(f'make -f "{makefile}" ROOT="{source_dir}" BUILD="{build_dir}" -j{jobs}')
+        result = run(["make", "-f", makefile, f"ROOT={source_dir}", f"BUILD={build_dir}", f"-j{jobs}"])
         if result.returncode != 0:
             print("FAIL: Failed to build wasm32 runtime")
             sys.exit(1)
@@ -118,6 +208,9 @@ def main():
 
     # Step 2: Test IR output
     if not args.skip_test:
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+
         print("\n" + "=" * 60)
         print("Step 2: Testing IR output (type sizes)")
         print("=" * 60)
@@ -125,55 +218,19 @@ def main():
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
 
-            # Create test program
-            hello_f90 = tmpdir / "hello.f90"
-            hello_f90.write_text('''\
+            # Create test programs
+            hello_src = '''\
 program hello
   print *, "Hello from wasm32!"
 end program hello
-''')
-
-            # Test wasm32 target uses i32
-            wasm_ll = tmpdir / "hello_wasm.ll"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -S -emit-llvm "{hello_f90}" -o "{wasm_ll}"')
-            if result.returncode != 0:
-                print("FAIL: Failed to compile for wasm32")
-                sys.exit(1)
-
-            wasm_ir = wasm_ll.read_text()
-            print("wasm32 IR snippet:")
-            for line in wasm_ir.splitlines():
-                if "_FortranAioOutputAscii" in line:
-                    print(f"  {line}")
-
-            if "_FortranAioOutputAscii(ptr, ptr, i32)" in wasm_ir:
-                print("PASS: wasm32 uses i32 for length parameter")
-            else:
-                print("FAIL: wasm32 should use i32, not i64")
-                sys.exit(1)
-
-            # Test native target uses i64
-            native_ll = tmpdir / "hello_native.ll"
-            result = run(f'"{flang}" -S -emit-llvm "{hello_f90}" -o "{native_ll}"')
-            if result.returncode != 0:
-                print("FAIL: Failed to compile for native")
-                sys.exit(1)
-
-            native_ir = native_ll.read_text()
-            print("\nnative IR snippet:")
-            for line in native_ir.splitlines():
-                if "_FortranAioOutputAscii" in line:
-                    print(f"  {line}")
-
-            if "_FortranAioOutputAscii(ptr, ptr, i64)" in native_ir:
-                print("PASS: native uses i64 for length parameter")
-            else:
-                print("FAIL: native should use i64")
-                sys.exit(1)
+'''
+            hello_f90 = tmpdir / "hello.f90"
+            hello_f90.write_text(hello_src)
 
-            # Test wasm32 fir.allocmem lowers to malloc(i32) not malloc(i64)
-            alloc_f90 = tmpdir / "alloc_test.f90"
-            alloc_f90.write_text('''\
+            # The wasm32 OutputAscii and malloc checks only scan declarations,
+            # so hello and the allocatable test share one flang run
+            hello_alloc_f90 = tmpdir / "hello_alloc.f90"
+            hello_alloc_f90.write_text(hello_src + '''
 function make(n) result(arr)
   integer, intent(in) :: n
   real :: arr(n)
@@ -193,30 +250,6 @@ subroutine caller(n)
 end subroutine
 ''')
 
-            alloc_ll = tmpdir / "alloc_wasm.ll"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -S -emit-llvm "{alloc_f90}" -o "{alloc_ll}"')
-            if result.returncode != 0:
-                print("FAIL: Failed to compile allocatable array for wasm32")
-                sys.exit(1)
-
-            alloc_ir = alloc_ll.read_text()
-            print("\nwasm32 malloc IR snippet:")
-            for line in alloc_ir.splitlines():
-                if "malloc" in line.lower():
-                    print(f"  {line}")
-
-            if "declare ptr @malloc(i32)" in alloc_ir:
-                print("PASS: wasm32 malloc uses i32 parameter")
-            else:
-                if "declare ptr @malloc(i64)" in alloc_ir:
-                    print("FAIL: wasm32 malloc uses i64 instead of i32")
-                else:
-                    print("FAIL: malloc declaration not found in IR")
-                sys.exit(1)
-
-            # Test assumed-size arrays compile for wasm32
-            # regression: fir.assumed_size_extent lowers via genConstantIndex
-            # which must use target-width (i32) not hardcoded i64
             assumed_f90 = tmpdir / "assumed_size.f90"
             assumed_f90.write_text('''\
 subroutine saxpy(n, a, sx, sy)
@@ -231,16 +264,6 @@ subroutine saxpy(n, a, sx, sy)
 end subroutine
 ''')
 
-            assumed_ll = tmpdir / "assumed_wasm.ll"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -S -emit-llvm "{assumed_f90}" -o "{assumed_ll}"')
-            if result.returncode != 0:
-                print("FAIL: assumed-size array failed to compile for wasm32")
-                print("  (genConstantIndex likely using i64 attr on i32 target)")
-                sys.exit(1)
-            print("PASS: assumed-size array compiles for wasm32")
-
-            # Test complex arithmetic compiles for wasm32
-            # exercises TargetWasm32 complex arg/return marshalling
             complex_f90 = tmpdir / "complex_test.f90"
             complex_f90.write_text('''\
 function cadd(a, b) result(c)
@@ -256,15 +279,6 @@ subroutine cmath(x, y, z)
 end subroutine
 ''')
 
-            complex_ll = tmpdir / "complex_wasm.ll"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -S -emit-llvm "{complex_f90}" -o "{complex_ll}"')
-            if result.returncode != 0:
-                print("FAIL: complex arithmetic failed to compile for wasm32")
-                sys.exit(1)
-            print("PASS: complex arithmetic compiles for wasm32")
-
-            # Test character operations compile for wasm32
-            # exercises DLGetModel<unsigned long> for string length params
             char_f90 = tmpdir / "char_test.f90"
             char_f90.write_text('''\
 subroutine greet(name, msg)
@@ -274,8 +288,109 @@ subroutine greet(name, msg)
 end subroutine
 ''')
 
+            reduce_f90 = tmpdir / "reduce_test.f90"
+            reduce_f90.write_text('''\
+subroutine compute(arr, n, total, biggest)
+  integer, intent(in) :: n
+  real, intent(in) :: arr(n)
+  real, intent(out) :: total, biggest
+  total = sum(arr)
+  biggest = maxval(arr)
+end subroutine
+''')
+
+            wasm_ll = tmpdir / "hello_wasm.ll"
+            native_ll = tmpdir / "hello_native.ll"
+            assumed_ll = tmpdir / "assumed_wasm.ll"
+            complex_ll = tmpdir / "complex_wasm.ll"
             char_ll = tmpdir / "char_wasm.ll"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -S -emit-llvm "{char_f90}" -o "{char_ll}"')
+            reduce_ll = tmpdir / "reduce_wasm.ll"
+
+            # Compile every IR test concurrently (each flang run is its own
+            # process); output and checks are still reported in order below
+            wasm_ir_cmd = [flang, "--target=wasm32-unknown-emscripten", "-S", "-emit-llvm"]
+            native_ir_cmd = [flang, "-S", "-emit-llvm"]
+            with ThreadPoolExecutor(max_workers=available_cpus()) as ir_executor:
+                ir_jobs = {
+                    wasm_ll: submit_captured(ir_executor, wasm_ir_cmd + [hello_alloc_f90, "-o", wasm_ll]),
+                    native_ll: submit_captured(ir_executor, native_ir_cmd + [hello_f90, "-o", native_ll]),
+                    assumed_ll: submit_captured(ir_executor, wasm_ir_cmd + [assumed_f90, "-o", assumed_ll]),
+                    complex_ll: submit_captured(ir_executor, wasm_ir_cmd + [complex_f90, "-o", complex_ll]),
+                    char_ll: submit_captured(ir_executor, wasm_ir_cmd + [char_f90, "-o", char_ll]),
+                    reduce_ll: submit_captured(ir_executor, wasm_ir_cmd + [reduce_f90, "-o", reduce_ll]),
+                }
+
+            # Test wasm32 target uses i32
+            result = wait_and_report(ir_jobs[wasm_ll])
+            if result.returncode != 0:
+                print("FAIL: Failed to compile hello/allocatable test for wasm32")
+                sys.exit(1)
+
+            wasm_lines, wasm_widths = grep_ir(wasm_ll, OUTPUT_ASCII_LINE_RE)
+            print("wasm32 IR snippet:")
+            for line in wasm_lines:
+                print(f"  {line}")
+
+            if b"i32" in wasm_widths:
+                print("PASS: wasm32 uses i32 for length parameter")
+            else:
+                print("FAIL: wasm32 should use i32, not i64")
+                sys.exit(1)
+
+            # Test native target uses i64
+            result = wait_and_report(ir_jobs[native_ll])
+            if result.returncode != 0:
+                print("FAIL: Failed to compile for native")
+                sys.exit(1)
+
+            native_lines, native_widths = grep_ir(native_ll, OUTPUT_ASCII_LINE_RE)
+            print("\nnative IR snippet:")
+            for line in native_lines:
+                print(f"  {line}")
+
+            if b"i64" in native_widths:
+                print("PASS: native uses i64 for length parameter")
+            else:
+                print("FAIL: native should use i64")
+                sys.exit(1)
+
+            # Test wasm32 fir.allocmem lowers to malloc(i32) not malloc(i64)
+            # (compiled into hello_wasm.ll above)
+            malloc_lines, malloc_widths = grep_ir(wasm_ll, MALLOC_LINE_RE)
+            print("\nwasm32 malloc IR snippet:")
+            for line in malloc_lines:
+                print(f"  {line}")
+
+            if b"i32" in malloc_widths:
+                print("PASS: wasm32 malloc uses i32 parameter")
+            else:
+                if b"i64" in malloc_widths:
+                    print("FAIL: wasm32 malloc uses i64 instead of i32")
+                else:
+                    print("FAIL: malloc declaration not found in IR")
+                sys.exit(1)
+
+            # Test assumed-size arrays compile for wasm32
+            # regression: fir.assumed_size_extent lowers via genConstantIndex
+            # which must use target-width (i32) not hardcoded i64
+            result = wait_and_report(ir_jobs[assumed_ll])
+            if result.returncode != 0:
+                print("FAIL: assumed-size array failed to compile for wasm32")
+                print("  (genConstantIndex likely using i64 attr on i32 target)")
+                sys.exit(1)
+            print("PASS: assumed-size array compiles for wasm32")
+
+            # Test complex arithmetic compiles for wasm32
+            # exercises TargetWasm32 complex arg/return marshalling
+            result = wait_and_report(ir_jobs[complex_ll])
+            if result.returncode != 0:
+                print("FAIL: complex arithmetic failed to compile for wasm32")
+                sys.exit(1)
+            print("PASS: complex arithmetic compiles for wasm32")
+
+            # Test character operations compile for wasm32
+            # exercises DLGetModel<unsigned long> for string length params
+            result = wait_and_report(ir_jobs[char_ll])
             if result.returncode != 0:
                 print("FAIL: character operations failed to compile for wasm32")
                 sys.exit(1)
@@ -289,19 +404,7 @@ end subroutine
 
             # Test array intrinsics (SUM, MAXVAL) compile for wasm32
             # exercises runtime function signatures with size_t params
-            reduce_f90 = tmpdir / "reduce_test.f90"
-            reduce_f90.write_text('''\
-subroutine compute(arr, n, total, biggest)
-  integer, intent(in) :: n
-  real, intent(in) :: arr(n)
-  real, intent(out) :: total, biggest
-  total = sum(arr)
-  biggest = maxval(arr)
-end subroutine
-''')
-
-            reduce_ll = tmpdir / "reduce_wasm.ll"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -S -emit-llvm "{reduce_f90}" -o "{reduce_ll}"')
+            result = wait_and_report(ir_jobs[reduce_ll])
             if result.returncode != 0:
                 print("FAIL: array intrinsics failed to compile for wasm32")
                 sys.exit(1)
@@ -321,20 +424,20 @@ end subroutine
 
             # Compile to object
             hello_o = tmpdir / "hello.o"
-            result = run(f'"{flang}" --target=wasm32-unknown-emscripten -c "{hello_f90}" -o "{hello_o}"')
+            result = run([flang, "--target=wasm32-unknown-emscripten", "-c", hello_f90, "-o", hello_o])
             if result.returncode != 0:
                 print("FAIL: Failed to compile to object")
                 sys.exit(1)
 
             # Link with emcc
             hello_js = tmpdir / "hello.js"
-            result = run(f'emcc "{hello_o}" "{wasm32_runtime}" -o "{hello_js}"')
+            result = run(["emcc", hello_o, wasm32_runtime, "-o", hello_js])
             if result.returncode != 0:
                 print("FAIL: Failed to link with emcc")
                 sys.exit(1)
 
             # Run with Node.js
-            result = run(f'node "{hello_js}"')
+            result = run(["node", hello_js], capture=True)
             if result.returncode != 0:
                 print("FAIL: Failed to run with Node.js")
                 sys.exit(1)
@@ -366,10 +469,21 @@ end subroutine
             wasm32_rt_dir = install_dir / "lib" / "wasm32-unknown-emscripten"
         wasm32_rt_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy runtime
-        import shutil
+        # Hardlink the runtime when build and install share a filesystem;
+        # otherwise copy (copy2 already uses sendfile/fcopyfile where it can).
+        # Either is staged under a temp name and renamed over dest, so the
+        # build output is never unlinked or copied onto itself.
         dest = wasm32_rt_dir / "libflang_rt.runtime.wasm32.a"
-        shutil.copy2(wasm32_runtime, dest)
+        if dest.exists() and os.path.samefile(wasm32_runtime, dest):
+            print("Runtime already installed (same file)")
+        else:
+            staged = dest.with_name(dest.name + ".tmp")
+            staged.unlink(missing_ok=True)
+            try:
+                os.link(wasm32_runtime, staged)
+            except OSError:
+                shutil.copy2(wasm32_runtime, staged)
+            os.replace(staged, dest)
 
         print(f"Installed: {dest}")
         print(f"PASS: wasm32 runtime installed as sibling to native flang_rt")
@@ -5,23 +5,29 @@ from __future__ import annotations
 
 import argparse
 import json
-from datetime import datetime, timezone
+import os
+import time
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 
 
+SCCACHE_CHUNK_CHARS = 64 * 1024
+SCCACHE_TRUNCATED_PREFIX = "...[truncated]\n"
+
+
 def parse_timing_lines(path: Path) -> dict[str, int]:
-    timings: dict[str, int] = {}
-    if not path.exists():
-        return timings
+    # a step that failed early leaves the file missing or empty
+    try:
+        if os.stat(path).st_size == 0:
+            return {}
+    except FileNotFoundError:
+        return {}
 
+    timings: dict[str, int] = {}
     for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
+        key, sep, value = raw.partition("=")
         key = key.strip()
-        value = value.strip()
-        if not key:
+        if not sep or not key:
             continue
         try:
             timings[key] = int(value)
@@ -30,6 +36,80 @@ def parse_timing_lines(path: Path) -> dict[str, int]:
     return timings
 
 
+def utc_timestamp() -> str:
+    """Return the current UTC time like ``datetime.now(timezone.utc).isoformat()``."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.gmtime(seconds)
+    micros = nanos // 1000
+    fraction = f".{micros:06d}" if micros else ""
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}{fraction}+00:00"
+    )
+
+
+def _tail_bytes(path: Path, n: int) -> tuple[bytes, bool]:
+    """Return the last ``n`` bytes of ``path`` and whether anything was cut."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        truncated = os.fstat(fd).st_size > n
+        if truncated:
+            os.lseek(fd, -n, os.SEEK_END)
+        chunks = []
+        while n > 0 and (chunk := os.read(fd, n)):
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b"".join(chunks), truncated
+    finally:
+        os.close(fd)
+
+
+def write_sccache_raw(f, sccache_file: Path, max_bytes: int) -> None:
+    """Write the sccache log to ``f`` as a JSON string.
+
+    At most the last ``max_bytes`` are kept (0 keeps the whole log, streamed
+    one chunk at a time).
+    """
+    if not sccache_file.exists():
+        f.write(encode_basestring_ascii("sccache stats unavailable").encode("ascii"))
+        return
+    if max_bytes > 0:
+        data, truncated = _tail_bytes(sccache_file, max_bytes)
+        # match text-mode reads: universal newlines, and a cut may split a
+        # multi-byte character
+        text = data.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+        if truncated:
+            text = SCCACHE_TRUNCATED_PREFIX + text
+        f.write(encode_basestring_ascii(text).encode("ascii"))
+        return
+    f.write(b'"')
+    with sccache_file.open(encoding="utf-8") as src:
+        while chunk := src.read(SCCACHE_CHUNK_CHARS):
+            # per-character escaping, so chunks can be encoded independently
+            f.write(encode_basestring_ascii(chunk)[1:-1].encode("ascii"))
+    f.write(b'"')
+
+
+def write_payload(f, payload: dict, sccache_file: Path, max_bytes: int) -> None:
+    """Write ``payload`` plus a streamed ``sccache_stats_raw`` field to ``f``.
+
+    The layout matches ``json.dumps(..., indent=2, sort_keys=True)``; the top
+    level is written field by field so the sccache log can be streamed into
+    its slot.
+    """
+    keys = sorted([*payload, "sccache_stats_raw"])
+    for i, key in enumerate(keys):
+        f.write(b",\n  " if i else b"{\n  ")
+        f.write(encode_basestring_ascii(key).encode("ascii") + b": ")
+        if key == "sccache_stats_raw":
+            write_sccache_raw(f, sccache_file, max_bytes)
+        else:
+            # indent nested values one level; encoded strings never contain "\n"
+            value = json.dumps(payload[key], indent=2, sort_keys=True)
+            f.write(value.replace("\n", "\n  ").encode("ascii"))
+    f.write(b"\n}\n")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--platform-id", required=True)
@@ -42,6 +122,12 @@ def main() -> None:
     parser.add_argument("--timings-file", required=True)
     parser.add_argument("--sccache-file", required=True)
     parser.add_argument("--output", required=True)
+    parser.add_argument(
+        "--sccache-max-bytes",
+        type=int,
+        default=64 * 1024,
+        help="Keep only the last N bytes of the sccache stats (0 keeps all).",
+    )
     args = parser.parse_args()
 
     timings_file = Path(args.timings_file)
@@ -51,14 +137,9 @@ def main() -> None:
     durations = parse_timing_lines(timings_file)
     total_seconds = sum(durations.values())
 
-    if sccache_file.exists():
-        sccache_raw = sccache_file.read_text(encoding="utf-8")
-    else:
-        sccache_raw = "sccache stats unavailable"
-
     payload = {
         "schema_version": 1,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": utc_timestamp(),
         "platform_id": args.platform_id,
         "target_triple": args.target_triple,
         "llvm_version": args.llvm_version,
@@ -70,12 +151,10 @@ def main() -> None:
         },
         "step_durations_seconds": durations,
         "timed_total_seconds": total_seconds,
-        "sccache_stats_raw": sccache_raw,
     }
 
-    output_file.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    with output_file.open("wb") as f:
+        write_payload(f, payload, sccache_file, args.sccache_max_bytes)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+"""Tests for scripts/_llvm_update_core.py. Run: python -m unittest discover tests"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import _llvm_update_core as core  # noqa: E402
+
+
+def rest_pages(*pages):
+    """Fake fetch_bytes serving one REST tags page per call."""
+    bodies = iter([json.dumps([{"name": name} for name in page]).encode() for page in pages])
+    return mock.Mock(side_effect=lambda req, timeout: next(bodies))
+
+
+def graphql_pages(*pages):
+    """Fake request_bytes serving one GraphQL refs page per call."""
+    bodies = []
+    for i, page in enumerate(pages):
+        refs = {
+            "nodes": [{"name": name.removeprefix("llvmorg-")} for name in page],
+            "pageInfo": {"hasNextPage": i + 1 < len(pages), "endCursor": str(i)},
+        }
+        bodies.append(json.dumps({"data": {"repository": {"refs": refs}}}).encode())
+    bodies = iter(bodies)
+    return mock.Mock(side_effect=lambda req, timeout: next(bodies))
+
+
+class ListLlvmTagsPagingTest(unittest.TestCase):
+    # a 17.0.x backport cut after 18.1.0 sorts ahead of newer 18.1.x tags
+    PAGES = (
+        ["llvmorg-18.1.1", "llvmorg-17.0.7", "llvmorg-18.1.0"],
+        ["llvmorg-18.1.2", "llvmorg-17.0.6"],
+        ["llvmorg-17.0.5", "llvmorg-16.0.6"],
+        ["llvmorg-15.0.7"],
+    )
+
+    def check(self, tags):
+        self.assertIn("llvmorg-18.1.2", tags)
+        self.assertEqual(core.find_latest_patch(tags, "18.1"), "18.1.2")
+        # the third page is entirely older than 18.1, so paging stops there
+        self.assertNotIn("llvmorg-15.0.7", tags)
+
+    def test_rest_keeps_paging_past_out_of_order_backport(self):
+        fetch = rest_pages(*self.PAGES)
+        with mock.patch.object(core, "GITHUB_TOKEN", ""), mock.patch.object(core, "fetch_bytes", fetch):
+            tags = core.list_llvm_tags(tracked_minors={(18, 1)})
+        self.check(tags)
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_graphql_keeps_paging_past_out_of_order_backport(self):
+        request = graphql_pages(*self.PAGES)
+        with mock.patch.object(core, "GITHUB_TOKEN", "token"), mock.patch.object(core, "request_bytes", request):
+            tags = core.list_llvm_tags(tracked_minors={(18, 1)})
+        self.check(tags)
+        self.assertEqual(request.call_count, 3)
+
+    def test_rest_name_order_waits_for_every_tracked_minor(self):
+        # REST sorts by name: single-digit majors come before llvmorg-2x.*
+        pages = (
+            ["llvmorg-9.0.1", "llvmorg-9.0.0", "llvmorg-8.0.1"],
+            ["llvmorg-3.9.1", "llvmorg-20.1.8", "llvmorg-20.1.7"],
+            ["llvmorg-2.9", "llvmorg-19.1.7", "llvmorg-19.1.6"],
+            ["llvmorg-18.1.8", "llvmorg-18.1.7"],
+            ["llvmorg-17.0.6"],
+        )
+        fetch = rest_pages(*pages)
+        with mock.patch.object(core, "GITHUB_TOKEN", ""), mock.patch.object(core, "fetch_bytes", fetch):
+            tags = core.list_llvm_tags(tracked_minors={(19, 1), (20, 1)})
+        self.assertEqual(core.find_latest_patch(tags, "19.1"), "19.1.7")
+        self.assertEqual(core.find_latest_patch(tags, "20.1"), "20.1.8")
+        # both minors are covered by page 3 and page 4 is entirely older
+        self.assertEqual(fetch.call_count, 4)
+        self.assertNotIn("llvmorg-17.0.6", tags)
+
+
+class ParseVersionsEnvTest(unittest.TestCase):
+    def test_crlf_and_empty_values(self):
+        text = "# comment\r\nLLVM_VERSION=19.1.7\r\nLLVM_FORK_REF=\r\nTRACKED_LLVM_MINOR = 19.1 \r\n"
+        expected = {"LLVM_VERSION": "19.1.7", "LLVM_FORK_REF": "", "TRACKED_LLVM_MINOR": "19.1"}
+        self.assertEqual(dict(core.ENV_ASSIGNMENT_RE.findall(text)), expected)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "versions.env"
+            path.write_bytes(text.encode("utf-8"))
+            self.assertEqual(core.parse_versions_env(path), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for scripts/write_ci_metrics.py. Run: python -m unittest discover tests"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import write_ci_metrics  # noqa: E402
+
+
+class ParseTimingLinesTest(unittest.TestCase):
+    def parse(self, text):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "timings.txt"
+            path.write_bytes(text.encode("utf-8"))
+            return write_ci_metrics.parse_timing_lines(path)
+
+    def test_accepts_any_key_and_int_value(self):
+        text = "configure=12\r\n  my step = 3 \nbuild=1_000\nlink=+7\n"
+        self.assertEqual(
+            self.parse(text), {"configure": 12, "my step": 3, "build": 1000, "link": 7}
+        )
+
+    def test_skips_malformed_lines(self):
+        self.assertEqual(self.parse("no separator\n=5\nstep=abc\nok=1\n"), {"ok": 1})
+
+    def test_missing_or_empty_file(self):
+        self.assertEqual(self.parse(""), {})
+        self.assertEqual(write_ci_metrics.parse_timing_lines(Path("/nonexistent/timings")), {})
+
+
+class WritePayloadTest(unittest.TestCase):
+    PAYLOAD = {
+        "schema_version": 1,
+        "step_durations_seconds": {"build": 3, "configure": 1},
+        "workflow": {"run_id": "7"},
+        "empty": {},
+    }
+
+    def write(self, log, max_bytes):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sccache.txt"
+            if log is not None:
+                path.write_bytes(log.encode("utf-8"))
+            f = io.BytesIO()
+            write_ci_metrics.write_payload(f, self.PAYLOAD, path, max_bytes)
+            return f.getvalue()
+
+    def test_matches_json_dumps(self):
+        log = "Compile requests  12\r\nHits \u00e9\u2713 \"q\"\n"
+        for max_bytes in (0, 1 << 16):
+            expected = {**self.PAYLOAD, "sccache_stats_raw": log.replace("\r\n", "\n")}
+            self.assertEqual(
+                self.write(log, max_bytes),
+                (json.dumps(expected, indent=2, sort_keys=True) + "\n").encode("ascii"),
+            )
+
+    def test_missing_log(self):
+        data = json.loads(self.write(None, 0))
+        self.assertEqual(data["sccache_stats_raw"], "sccache stats unavailable")
+
+
+if __name__ == "__main__":
+    unittest.main()